@@ -210,12 +210,15 @@ def demo_advanced_features():
 
     # Filter rows (manual iteration)
     print("Engineering department employees:")
-    for row_dict in model.iter_rows():
-        if row_dict["Department"] == "Engineering":
-            print(f"  {row_dict['Name']}: {row_dict['Salary']}")
+    name_idx = model.column_index("Name")
+    dept_idx = model.column_index("Department")
+    salary_idx = model.column_index("Salary")
+    for row in model.iter_rows(row_format="tuple"):
+        if row[dept_idx] == "Engineering":
+            print(f"  {row[name_idx]}: {row[salary_idx]}")
 
     # Calculate statistics
-    salaries = [int(row["Salary"]) for row in model.iter_rows()]
+    salaries = [int(value) for value in model.column_values("Salary")]
     print("\nSalary statistics:")
     print(f"  Average: ${sum(salaries) / len(salaries):.2f}")
     print(f"  Min: ${min(salaries)}")
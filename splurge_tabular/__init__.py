@@ -2,6 +2,10 @@
 
 A Python library for tabular data processing with in-memory and streaming support.
 
+Public names are imported lazily (PEP 562) on first attribute access, so that
+lightweight entry points such as the CLI do not pay for importing the data
+models and their dependencies.
+
 Copyright (c) 2025 Jim Schilling
 
 Please preserve this header and all related material when sharing!
@@ -11,25 +15,49 @@ This module is licensed under the MIT License.
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2025.2.0"
 
-# Main classes
-# Utility functions
-from .common_utils import ensure_minimum_columns
+if TYPE_CHECKING:
+    # Utility functions
+    from .common_utils import ensure_minimum_columns
+
+    # Exceptions
+    from .exceptions import (
+        SplurgeTabularError,
+        SplurgeTabularLookupError,
+        SplurgeTabularTypeError,
+        SplurgeTabularValueError,
+    )
+
+    # Protocols
+    from .protocols import StreamingTabularDataProtocol, TabularDataProtocol
 
-# Exceptions
-from .exceptions import (
-    SplurgeTabularError,
-    SplurgeTabularLookupError,
-    SplurgeTabularTypeError,
-    SplurgeTabularValueError,
-)
+    # Main classes
+    from .streaming_tabular_data_model import StreamingTabularDataModel
+    from .tabular_data_model import TabularDataModel
+    from .tabular_utils import normalize_rows, process_headers
 
-# Protocols
-from .protocols import StreamingTabularDataProtocol, TabularDataProtocol
-from .streaming_tabular_data_model import StreamingTabularDataModel
-from .tabular_data_model import TabularDataModel
-from .tabular_utils import normalize_rows, process_headers
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Main classes
+    "TabularDataModel": ".tabular_data_model",
+    "StreamingTabularDataModel": ".streaming_tabular_data_model",
+    # Protocols
+    "TabularDataProtocol": ".protocols",
+    "StreamingTabularDataProtocol": ".protocols",
+    # Utilities
+    "process_headers": ".tabular_utils",
+    "ensure_minimum_columns": ".common_utils",
+    "normalize_rows": ".tabular_utils",
+    # Exceptions
+    "SplurgeTabularError": ".exceptions",
+    "SplurgeTabularTypeError": ".exceptions",
+    "SplurgeTabularValueError": ".exceptions",
+    "SplurgeTabularLookupError": ".exceptions",
+}
 
 __all__ = [
     # Version
@@ -50,3 +78,35 @@ __all__ = [
     "SplurgeTabularValueError",
     "SplurgeTabularLookupError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access.
+
+    The resolved object is cached in the module globals so later lookups
+    bypass this hook entirely.
+
+    Args:
+        name (str): Attribute name being looked up.
+
+    Returns:
+        Any: The requested public object.
+
+    Raises:
+        AttributeError: If ``name`` is not a public name of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported public names.
+
+    Returns:
+        list[str]: Sorted attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
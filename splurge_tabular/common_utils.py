@@ -11,9 +11,10 @@ This module is licensed under the MIT License.
 """
 
 from collections.abc import Iterable, Iterator
-from typing import Any, TypeVar
+from itertools import repeat
+from typing import Any, Literal, TypeVar
 
-from .exceptions import SplurgeTabularTypeError
+from .exceptions import SplurgeTabularTypeError, SplurgeTabularValueError
 
 T = TypeVar("T")
 
@@ -66,13 +67,12 @@ def ensure_minimum_columns(
     Returns:
         list[str]: Row data padded to the minimum number of columns.
     """
-    if len(row) >= min_columns:
+    missing = min_columns - len(row)
+    if missing <= 0:
         return row
 
-    # Pad with empty strings to reach minimum columns
-    padded_row = row.copy()
-    padded_row.extend([fill_value] * (min_columns - len(row)))
-    return padded_row
+    # Pad with fill values to reach minimum columns (single concatenation)
+    return row + [fill_value] * missing
 
 
 def batch_validate_rows(
@@ -81,6 +81,9 @@ def batch_validate_rows(
     min_columns: int | None = None,
     max_columns: int | None = None,
     skip_empty: bool = True,
+    trust_input: bool = False,
+    error_mode: Literal["raise", "skip", "count"] = "raise",
+    invalid_rows: list[int] | None = None,
 ) -> Iterator[list[str]]:
     """Validate and normalize rows in a batch operation.
 
@@ -89,38 +92,94 @@ def batch_validate_rows(
         min_columns (int | None): Minimum columns per row (pad if needed).
         max_columns (int | None): Maximum columns per row (truncate if needed).
         skip_empty (bool): Whether to skip completely empty rows.
+        trust_input (bool): Assume every row is a list of non-None strings (e.g. rows
+            from a CSV reader) and skip the per-row type check and cell coercion.
+            Rows that need no padding or truncation are then yielded as-is rather
+            than copied.
+        error_mode (Literal["raise", "skip", "count"]): What to do with an invalid row:
+            raise an error (default), drop it silently, or drop it and append its
+            index to ``invalid_rows``. Dropping avoids building an exception per row
+            when bulk-loading data with known bad rows.
+        invalid_rows (list[int] | None): Receives the indexes of dropped rows when
+            ``error_mode`` is ``"count"``.
 
     Yields:
         list[str]: Validated and normalized rows.
 
     Raises:
-        SplurgeTabularTypeError: If row validation fails.
+        SplurgeTabularTypeError: If row validation fails and error_mode is "raise".
+        SplurgeTabularValueError: If error_mode is unknown, or is "count" without invalid_rows.
     """
+    if error_mode not in ("raise", "skip", "count"):
+        raise SplurgeTabularValueError(
+            message=f"Invalid error_mode '{error_mode}', expected 'raise', 'skip' or 'count'",
+            details={"param": "error_mode", "value": str(error_mode)},
+        )
+    if error_mode == "count" and invalid_rows is None:
+        raise SplurgeTabularValueError(
+            message="invalid_rows is required when error_mode is 'count'",
+            details={"param": "invalid_rows"},
+        )
+
     for row_idx, row in enumerate(rows):
-        # Validate row is list-like before attempting to iterate
-        if not isinstance(row, list):
-            raise SplurgeTabularTypeError(
-                message=f"Row {row_idx} must be a list, got {type(row).__name__}",
-                details={"row_index": str(row_idx), "received_type": type(row).__name__},
-            )
-
-        # Skip empty rows if requested (handle non-string cells safely)
-        if skip_empty and not any((cell is not None and str(cell).strip()) for cell in row):
+        if trust_input:
+            normalized_row = row
+        else:
+            # Validate row is list-like before attempting to iterate
+            if not isinstance(row, list):
+                if error_mode == "raise":  # type: ignore[unreachable]
+                    raise SplurgeTabularTypeError(
+                        message=f"Row {row_idx} must be a list, got {type(row).__name__}",
+                        details={"row_index": str(row_idx), "received_type": type(row).__name__},
+                    )
+                # Bad rows are dropped without building an exception
+                if error_mode == "count" and invalid_rows is not None:
+                    invalid_rows.append(row_idx)
+                continue
+
+            # Ensure all cells are strings
+            normalized_row = _coerce_cells(row)
+
+        # Skip empty rows if requested; join + strip checks the whole row in C
+        if skip_empty and not "".join(normalized_row).strip():
             continue
 
-        # Ensure all cells are strings
-        normalized_row = [str(cell) if cell is not None else "" for cell in row]
-
         # Apply column constraints
-        if min_columns is not None and len(normalized_row) < min_columns:
-            normalized_row = ensure_minimum_columns(normalized_row, min_columns)
-
-        if max_columns is not None and len(normalized_row) > max_columns:
+        width = len(normalized_row)
+        if min_columns is not None and width < min_columns:
+            padding = [""] * (min_columns - width)
+            if trust_input:
+                # Never mutate caller-owned rows
+                normalized_row = normalized_row + padding
+            else:
+                # The row is already a private copy, so pad in place
+                normalized_row.extend(padding)
+            width = min_columns
+
+        if max_columns is not None and width > max_columns:
             normalized_row = normalized_row[:max_columns]
 
         yield normalized_row
 
 
+def _coerce_cells(row: list[Any]) -> list[str]:
+    """Return a copy of a row with every cell coerced to a string.
+
+    Rows holding only strings (the common case for parsed CSV/DSV input) are
+    detected and copied using C-level builtins; rows with other cell types fall
+    back to per-cell coercion, mapping ``None`` to an empty string.
+
+    Args:
+        row (list[Any]): Row data.
+
+    Returns:
+        list[str]: New list containing the string form of each cell.
+    """
+    if all(map(isinstance, row, repeat(str))):
+        return list(row)
+    return [str(cell) if cell is not None else "" for cell in row]
+
+
 def normalize_string(
     value: str | None,
     *,
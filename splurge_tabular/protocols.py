@@ -11,11 +11,14 @@ Please preserve this header and all related material when sharing!
 This module is licensed under the MIT License.
 """
 
-from collections.abc import Generator, Iterator
-from typing import Protocol, runtime_checkable
+from collections.abc import Iterator
+from typing import Literal, Protocol, TypeAlias, overload, runtime_checkable
 
 from ._vendor.splurge_typer.data_type import DataType
 
+RowFormat: TypeAlias = Literal["dict", "tuple", "list"]
+"""Shape of the rows yielded by ``iter_rows``."""
+
 
 @runtime_checkable
 class TabularDataProtocol(Protocol):
@@ -138,19 +141,42 @@ class TabularDataProtocol(Protocol):
         """
         ...  # pragma: no cover
 
-    def iter_rows(self) -> Generator[dict[str, str], None, None]:
-        """Iterate over rows as dictionaries.
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["dict"] = ..., reuse_row: bool = ...
+    ) -> Iterator[dict[str, str]]: ...  # pragma: no cover
+
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["tuple"], reuse_row: bool = ...
+    ) -> Iterator[tuple[str, ...]]: ...  # pragma: no cover
+
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["list"], reuse_row: bool = ...
+    ) -> Iterator[list[str]]: ...  # pragma: no cover
+
+    def iter_rows(
+        self, *, row_format: RowFormat = "dict", reuse_row: bool = False
+    ) -> Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+        """Iterate over rows in the requested format.
+
+        Args:
+            row_format (RowFormat): ``"dict"`` (keyed by column name), ``"tuple"``
+                or ``"list"`` (positional values).
+            reuse_row (bool): For ``"dict"`` rows, yield one dict updated in place.
 
         Returns:
-            Generator[dict[str, str], None, None]: Generator yielding rows as dictionaries with column names as keys.
+            Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+                Iterator yielding rows in the requested format.
         """
         ...  # pragma: no cover
 
-    def iter_rows_as_tuples(self) -> Generator[tuple[str, ...], None, None]:
+    def iter_rows_as_tuples(self) -> Iterator[tuple[str, ...]]:
         """Iterate over rows as tuples.
 
         Returns:
-            Generator[tuple[str, ...], None, None]: Generator yielding rows as tuples of values.
+            Iterator[tuple[str, ...]]: Iterator yielding rows as tuples of values.
         """
         ...  # pragma: no cover
 
@@ -200,19 +226,42 @@ class StreamingTabularDataProtocol(Protocol):
         """
         ...  # pragma: no cover
 
-    def iter_rows(self) -> Generator[dict[str, str], None, None]:
-        """Iterate over rows as dictionaries.
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["dict"] = ..., reuse_row: bool = ...
+    ) -> Iterator[dict[str, str]]: ...  # pragma: no cover
+
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["tuple"], reuse_row: bool = ...
+    ) -> Iterator[tuple[str, ...]]: ...  # pragma: no cover
+
+    @overload
+    def iter_rows(
+        self, *, row_format: Literal["list"], reuse_row: bool = ...
+    ) -> Iterator[list[str]]: ...  # pragma: no cover
+
+    def iter_rows(
+        self, *, row_format: RowFormat = "dict", reuse_row: bool = False
+    ) -> Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+        """Iterate over rows in the requested format.
+
+        Args:
+            row_format (RowFormat): ``"dict"`` (keyed by column name), ``"tuple"``
+                or ``"list"`` (positional values).
+            reuse_row (bool): For ``"dict"`` rows, yield one dict updated in place.
 
         Returns:
-            Generator[dict[str, str], None, None]: Generator yielding rows as dictionaries with column names as keys.
+            Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+                Iterator yielding rows in the requested format.
         """
         ...  # pragma: no cover
 
-    def iter_rows_as_tuples(self) -> Generator[tuple[str, ...], None, None]:
+    def iter_rows_as_tuples(self) -> Iterator[tuple[str, ...]]:
         """Iterate over rows as tuples.
 
         Returns:
-            Generator[tuple[str, ...], None, None]: Generator yielding rows as tuples of values.
+            Iterator[tuple[str, ...]]: Iterator yielding rows as tuples of values.
         """
         ...  # pragma: no cover
 
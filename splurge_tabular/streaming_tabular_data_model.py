@@ -10,15 +10,23 @@ Please preserve this header and all related material when sharing!
 This module is licensed under the MIT License.
 """
 
-from collections.abc import Generator, Iterator
+import queue
+import sys
+import threading
+from collections.abc import Callable, Generator, Iterator
+from contextlib import closing
+from itertools import chain, filterfalse
+from typing import Literal, overload
 
 from .exceptions import (
     SplurgeTabularLookupError,
     SplurgeTabularTypeError,
     SplurgeTabularValueError,
 )
-from .protocols import StreamingTabularDataProtocol
+from .protocols import RowFormat, StreamingTabularDataProtocol
+from .tabular_utils import make_row_dict_builder as _make_row_dict_builder
 from .tabular_utils import process_headers as _process_headers
+from .tabular_utils import should_skip_row as _should_skip_row
 
 
 class StreamingTabularDataModel(StreamingTabularDataProtocol):
@@ -36,6 +44,8 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
 
     DEFAULT_CHUNK_SIZE = 1000
     MIN_CHUNK_SIZE = 100
+    # Distinct values kept in the intern pool; further new values are passed through
+    INTERN_POOL_MAX_SIZE = 100_000
 
     def __init__(
         self,
@@ -44,6 +54,11 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
         header_rows: int = 1,
         skip_empty_rows: bool = True,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch: int = 0,
+        intern_columns: list[str] | None = None,
+        copy_rows: bool = False,
+        strict_schema: bool = False,
+        on_schema_widen: Callable[[int, int], None] | None = None,
     ) -> None:
         """
         Initialize StreamingTabularDataModel.
@@ -53,10 +68,26 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
             header_rows (int): Number of header rows to merge into column names.
             skip_empty_rows (bool): Skip empty rows in data.
             chunk_size (int): Maximum number of rows to keep in memory buffer (minimum 100).
+            prefetch (int): Number of chunks to read ahead of the consumer on a background
+                thread (0 disables prefetching). Useful when producing chunks is I/O bound.
+            intern_columns (list[str] | None): Names of low-cardinality columns whose values
+                are pooled, so repeated values in retained rows share one string object.
+            copy_rows (bool): Always yield new row lists, for callers that mutate rows.
+                By default full-width rows are the stream's own lists.
+            strict_schema (bool): Raise instead of adding generated columns when a row is
+                wider than the header.
+            on_schema_widen (Callable[[int, int], None] | None): Called with the old and new
+                column counts whenever the header is widened, before the widened chunk's
+                rows are yielded, so consumers can rebuild width-dependent caches.
 
         Raises:
             SplurgeTabularTypeError: If stream is None.
-            SplurgeTabularValueError: If header_rows or chunk_size is invalid.
+            SplurgeTabularValueError: If header_rows, chunk_size or prefetch is invalid.
+
+        Note:
+            The stream is not read until the model is first used (column access or
+            iteration). An unknown name in intern_columns raises SplurgeTabularLookupError
+            at that point.
         """
         if stream is None:
             raise SplurgeTabularTypeError(
@@ -73,56 +104,81 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
                 message=f"Chunk size must be at least {self.MIN_CHUNK_SIZE}",
                 details={"param": "chunk_size", "value": str(chunk_size)},
             )
+        if prefetch < 0:
+            raise SplurgeTabularValueError(
+                message="Prefetch must be greater than or equal to 0",
+                details={"param": "prefetch", "value": str(prefetch)},
+            )
 
         self._stream = stream
         self._header_rows = header_rows
         self._skip_empty_rows = skip_empty_rows
         self._chunk_size = chunk_size
+        self._prefetch = prefetch
+        self._prefetcher: _ChunkPrefetcher | None = None
+        self._copy_rows = copy_rows
+        self._strict_schema = strict_schema
+        self._on_schema_widen = on_schema_widen
 
         # Initialize state
         self._header_data: list[list[str]] = []
         self._column_names: list[str] = []
         self._column_index_map: dict[str, int] = {}
+        self._pad: list[str] = []
         self._buffer: list[list[str]] = []
         self._max_columns: int = 0
+        # Headers are read from the stream on first use, not here
         self._is_initialized: bool = False
 
-        # Process headers and initialize
-        self._initialize_from_stream()
+        # Value pool for intern_columns, bounded by INTERN_POOL_MAX_SIZE
+        self._intern_columns = list(intern_columns or ())
+        self._intern_indexes: list[int] = []
+        self._pool: dict[str, str] = {}
+        self._pool_hits = 0
+        self._pool_misses = 0
 
     def _initialize_from_stream(self) -> None:
         """Initialize the model by reading header rows from the stream.
 
         This method reads up to `self._header_rows` rows from the provided
-        stream iterator to form the header. Any remaining rows from the
-        first chunk are buffered for iteration. The method is idempotent and
-        will no-op if initialization has already completed.
+        stream iterator to form the header. Up to `self._chunk_size` of the
+        remaining rows from that chunk are buffered for iteration; any rows
+        beyond that are pushed back onto the stream. Without header rows,
+        leading chunks with no data rows are skipped and the generated column
+        names cover the widest buffered row. The method is idempotent and will
+        no-op if initialization has already completed.
+
+        Raises:
+            SplurgeTabularLookupError: If an ``intern_columns`` name is not a column.
         """
         if self._is_initialized:
             return
 
-        # Collect header rows from the stream
-        header_rows_collected = 0
+        # Collect header rows from the stream, then buffer the rest of that chunk
+        header_rows = self._header_rows
         header_data: list[list[str]] = []
-
-        for chunk in self._stream:
-            chunk_iter = iter(chunk)
-            for row in chunk_iter:
-                if header_rows_collected < self._header_rows:
-                    header_data.append(row)
-                    header_rows_collected += 1
-                else:
-                    # Buffer remaining rows in this chunk (including current), respecting skip_empty_rows
-                    if not (self._skip_empty_rows and all(cell.strip() == "" for cell in row)):
-                        self._buffer.append(row)
-
-                    # Process remaining rows in the chunk
-                    for remaining_row in chunk_iter:
-                        if not (self._skip_empty_rows and all(cell.strip() == "" for cell in remaining_row)):
-                            self._buffer.append(remaining_row)
-                    break
-            if header_rows_collected >= self._header_rows:
+        # Chunks read here, so they can be pushed back if the header is rejected
+        source = self._stream
+        consumed: list[list[list[str]]] = []
+
+        for chunk in source:
+            consumed.append(chunk)
+            missing = header_rows - len(header_data)
+            if missing > 0:
+                header_data.extend(chunk[:missing])
+                if len(header_data) < header_rows:
+                    continue
+                chunk = chunk[missing:]
+            if self._skip_empty_rows:
+                chunk = list(filterfalse(_should_skip_row, chunk))
+            if len(chunk) > self._chunk_size:
+                # Keep the buffer bounded; the rest is read again by __iter__
+                self._stream = chain([chunk[self._chunk_size :]], self._stream)
+                chunk = chunk[: self._chunk_size]
+            self._buffer.extend(chunk)
+            if chunk or header_rows > 0:
                 break
+            # Without a header the schema comes from the data, so skip leading empty chunks
 
         # Process headers
         if self._header_rows > 0:
@@ -130,22 +186,41 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
                 header_data,
                 header_rows=self._header_rows,
             )
-        # No headers, generate column names from first data row
+        # No headers, generate column names wide enough for every buffered row
         elif self._buffer:
-            self._max_columns = len(self._buffer[0])
-            self._column_names = [f"column_{i}" for i in range(self._max_columns)]
+            self._max_columns = max(map(len, self._buffer))
+            self._column_names = [sys.intern(f"column_{i}") for i in range(self._max_columns)]
 
         # Create column index map
         self._column_index_map = {name: i for i, name in enumerate(self._column_names)}
+        # Resolve intern columns before marking the model initialized, so an unknown
+        # name leaves the stream as it was and raises again on the next access
+        missing_names = [name for name in self._intern_columns if name not in self._column_index_map]
+        if missing_names:
+            self._buffer.clear()
+            self._stream = chain(consumed, source)
+            raise SplurgeTabularLookupError(
+                message=f"Column name {missing_names[0]} not found",
+                details={"name": missing_names[0]},
+            )
+        self._intern_indexes = [self._column_index_map[name] for name in self._intern_columns]
+        # Padding source for short rows, sliced per row and rebuilt when the header widens
+        self._pad = [""] * len(self._column_names)
         self._is_initialized = True
 
     @property
     def column_names(self) -> list[str]:
         """Get the list of column names.
 
+        The same list is returned on every access (no defensive copy) and is
+        extended in place when iteration encounters wider rows, so callers
+        must treat it as read-only.
+
         Returns:
-            List of column names in order.
+            list[str]: List of column names in order.
         """
+        if not self._is_initialized:
+            self._initialize_from_stream()
         return self._column_names
 
     def column_index(
@@ -163,12 +238,15 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
         Raises:
             SplurgeTabularLookupError: If column name is not found.
         """
-        if name not in self.column_names:
+        if not self._is_initialized:
+            self._initialize_from_stream()
+        try:
+            return self._column_index_map[name]
+        except KeyError:
             raise SplurgeTabularLookupError(
                 message=f"Column name {name} not found",
                 details={"name": name},
-            )
-        return self._column_index_map[name]
+            ) from None
 
     @property
     def column_count(self) -> int:
@@ -177,82 +255,385 @@ class StreamingTabularDataModel(StreamingTabularDataProtocol):
         Returns:
             int: Number of columns in the dataset.
         """
+        if not self._is_initialized:
+            self._initialize_from_stream()
         return len(self._column_names)
 
     def __iter__(self) -> Generator[list[str], None, None]:
         """Iterate over rows from the buffer and the underlying stream.
 
         Yields rows as lists of strings. New column names are auto-created if
-        later rows contain more columns than the current header.
+        later rows contain more columns than the current header. Rows are
+        normalized a chunk at a time, so every row of a chunk is padded to the
+        widest row in that chunk.
+
+        Rows that already match the column count are yielded as-is rather than
+        copied (they alias the stream's chunk), so callers must not mutate yielded
+        rows unless the model was created with ``copy_rows=True``.
 
         Yields:
             list[str]: Rows as lists of strings.
         """
-        # Yield buffered rows first
-        for row in self._buffer:
-            # Create a copy of the row to avoid modifying the original
-            row_copy = row.copy()
-            # Normalize row length
-            if len(row_copy) < len(self._column_names):
-                row_copy = row_copy + [""] * (len(self._column_names) - len(row_copy))
-            elif len(row_copy) > len(self._column_names):
-                while len(self._column_names) < len(row_copy):
-                    new_col_name = f"column_{len(self._column_names)}"
-                    self._column_names.append(new_col_name)
-                    self._column_index_map[new_col_name] = len(self._column_names) - 1
-            yield row_copy
-        self._buffer.clear()
+        if not self._is_initialized:
+            self._initialize_from_stream()
+
+        # Everything used per chunk is bound once; the header is widened in place
+        skip_empty = self._skip_empty_rows
+        is_blank = _should_skip_row
+        normalize_chunk = self._normalize_chunk
+        buffer = self._buffer
+
+        # Yield buffered rows first (already filtered when buffered)
+        yield from normalize_chunk(buffer)
+        buffer.clear()
 
         # Then yield remaining rows from stream, chunk by chunk
-        for chunk in self._stream:
-            for row in chunk:
-                if self._skip_empty_rows and all(cell.strip() == "" for cell in row):
-                    continue
-                # Create a copy of the row to avoid modifying the original
-                row_copy = row.copy()
-                # Normalize row length
-                if len(row_copy) < len(self._column_names):
-                    row_copy = row_copy + [""] * (len(self._column_names) - len(row_copy))
-                elif len(row_copy) > len(self._column_names):
-                    while len(self._column_names) < len(row_copy):
-                        new_col_name = f"column_{len(self._column_names)}"
-                        self._column_names.append(new_col_name)
-                        self._column_index_map[new_col_name] = len(self._column_names) - 1
-                yield row_copy
-
-    def iter_rows(self) -> Generator[dict[str, str], None, None]:
-        """Iterate over rows as dictionaries.
+        if self._prefetch <= 0:
+            for chunk in self._stream:
+                if skip_empty:
+                    chunk = list(filterfalse(is_blank, chunk))
+                yield from normalize_chunk(chunk)
+            return
+        # Closed explicitly, so read-ahead chunks go back onto the stream on early exit
+        with closing(self._prefetch_chunks()) as chunks:
+            for chunk in chunks:
+                if skip_empty:
+                    chunk = list(filterfalse(is_blank, chunk))
+                yield from normalize_chunk(chunk)
+
+    def _normalize_chunk(self, rows: list[list[str]]) -> list[list[str]]:
+        """Pad a chunk of rows to a common width, widening the header first if needed.
+
+        Args:
+            rows (list[list[str]]): Rows of one chunk.
+
+        Returns:
+            list[list[str]]: Rows padded to the column count; full-width rows are not copied.
+
+        Raises:
+            SplurgeTabularValueError: If ``strict_schema`` is set and a row is wider than the header.
+        """
+        ncols = len(self._column_names)
+        widest = max(map(len, rows), default=0)
+        if widest > ncols:
+            if self._strict_schema:
+                raise SplurgeTabularValueError(
+                    message=f"Row has {widest} columns, expected at most {ncols}",
+                    details={"columns": str(widest), "expected": str(ncols)},
+                )
+            old_ncols, ncols = ncols, self._extend_column_names(widest)
+            if self._on_schema_widen is not None:
+                self._on_schema_widen(old_ncols, ncols)
+        pad = self._pad
+        if self._copy_rows or self._intern_indexes:
+            # Every row becomes a new list exactly once; interning then writes into it
+            rows = [row[:] if len(row) == ncols else row + pad[len(row) :] for row in rows]
+            return self._intern_chunk(rows) if self._intern_indexes else rows
+        return [row if len(row) == ncols else row + pad[len(row) :] for row in rows]
+
+    def _intern_chunk(self, rows: list[list[str]]) -> list[list[str]]:
+        """Replace values of the intern columns with pooled equal strings, in place.
+
+        Args:
+            rows (list[list[str]]): Normalized rows of one chunk, already copied from the stream.
+
+        Returns:
+            list[list[str]]: The same rows, now sharing pooled values.
+        """
+        pool = self._pool
+        lookup = pool.get
+        indexes = self._intern_indexes
+        max_size = self.INTERN_POOL_MAX_SIZE
+        misses = 0
+        for row in rows:
+            for i in indexes:
+                value = row[i]
+                pooled = lookup(value)
+                if pooled is None:
+                    misses += 1
+                    if len(pool) < max_size:
+                        pool[value] = value
+                else:
+                    row[i] = pooled
+        self._pool_misses += misses
+        self._pool_hits += len(rows) * len(indexes) - misses
+        return rows
+
+    def pool_stats(self) -> tuple[int, int, int]:
+        """Get statistics for the ``intern_columns`` value pool.
+
+        Returns:
+            tuple[int, int, int]: ``(hits, misses, size)`` - values replaced by a pooled
+            string, values not found in the pool, and distinct values currently pooled.
+        """
+        return self._pool_hits, self._pool_misses, len(self._pool)
+
+    def _extend_column_names(self, width: int) -> int:
+        """Add generated column names until there are ``width`` columns.
+
+        Args:
+            width (int): Required number of columns.
+
+        Returns:
+            int: The new column count.
+        """
+        names = self._column_names
+        index_map = self._column_index_map
+        for i in range(len(names), width):
+            name = sys.intern(f"column_{i}")
+            index_map[name] = i
+            names.append(name)
+        self._pad = [""] * len(names)
+        return len(names)
+
+    def _prefetch_chunks(self) -> Generator[list[list[str]], None, None]:
+        """Read chunks from the stream on a background thread.
+
+        A producer thread pulls up to ``self._prefetch`` chunks ahead of the
+        consumer into a bounded queue, overlapping upstream I/O and parsing
+        with row processing. Exceptions raised by the stream are re-raised in
+        the consuming thread. Prefetching stops when the generator is closed or
+        when :meth:`clear_buffer` / :meth:`reset_stream` is called; chunks read
+        ahead but not yet consumed are then pushed back onto the stream, so a
+        later iteration resumes where this one stopped.
+
+        Yields:
+            list[list[str]]: Chunks in stream order.
+        """
+        # Only one producer may read the stream; finish any earlier one first
+        self._stop_prefetch()
+        prefetcher = _ChunkPrefetcher(self._stream, self._prefetch)
+        self._prefetcher = prefetcher
+        try:
+            yield from prefetcher.chunks()
+        finally:
+            if self._prefetcher is prefetcher:
+                self._stop_prefetch()
+
+    def _stop_prefetch(self) -> None:
+        """Stop a running prefetch thread, if any, and push its unread chunks back onto the stream."""
+        prefetcher, self._prefetcher = self._prefetcher, None
+        if prefetcher is not None:
+            pending = prefetcher.close()
+            if pending:
+                self._stream = chain(pending, self._stream)
+
+    def __length_hint__(self) -> int:
+        """Report that the number of rows left is unknown.
+
+        A stream's own length hint counts chunks rather than rows, and the buffer
+        only holds the first chunk, so neither gives a usable estimate for
+        pre-sizing ``list(model)``. ``operator.length_hint`` falls back to its
+        default when ``NotImplemented`` is returned.
+
+        Returns:
+            int: Always ``NotImplemented``.
+        """
+        # Deliberately no estimate: a wrong one over-allocates, and the buffer is
+        # empty for all but the first chunk
+        return NotImplemented  # type: ignore[no-any-return]
+
+    @overload
+    def iter_rows(self, *, row_format: Literal["dict"] = ..., reuse_row: bool = ...) -> Iterator[dict[str, str]]: ...
+
+    @overload
+    def iter_rows(self, *, row_format: Literal["tuple"], reuse_row: bool = ...) -> Iterator[tuple[str, ...]]: ...
+
+    @overload
+    def iter_rows(self, *, row_format: Literal["list"], reuse_row: bool = ...) -> Iterator[list[str]]: ...
+
+    def iter_rows(
+        self, *, row_format: RowFormat = "dict", reuse_row: bool = False
+    ) -> Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+        """Iterate over rows in the requested format.
+
+        The format is resolved once, before iteration starts, so ``"tuple"`` and
+        ``"list"`` rows skip dict construction entirely.
+
+        Args:
+            row_format (RowFormat): ``"dict"`` (keyed by column name, the default),
+                ``"tuple"`` or ``"list"`` (positional values, see ``column_index``).
+            reuse_row (bool): For ``"dict"`` rows, yield the same dict object on every
+                step, updated in place. Callers must not keep a reference to a row
+                past the next iteration; copy it with ``dict(row)`` if needed.
+
+        Returns:
+            Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+                Iterator yielding rows in the requested format.
+
+        Raises:
+            SplurgeTabularValueError: If row_format is not a supported format.
+        """
+        if not self._is_initialized:
+            # Dict rows bind the column list up front, so it must be the final one
+            self._initialize_from_stream()
+        if row_format == "dict":
+            return self._iter_row_dicts(reuse_row)
+        if row_format == "tuple":
+            return self.iter_rows_as_tuples()
+        if row_format == "list":
+            return iter(self)
+        raise SplurgeTabularValueError(
+            message=f"Invalid row_format '{row_format}', expected 'dict', 'tuple' or 'list'",
+            details={"param": "row_format", "value": str(row_format)},
+        )
+
+    def _iter_row_dicts(self, reuse_row: bool = False) -> Generator[dict[str, str], None, None]:
+        """Iterate over rows as dictionaries keyed by column name.
+
+        Args:
+            reuse_row (bool): Yield one dict, updated in place, instead of a new dict per row.
 
         Yields:
             dict[str, str]: Rows as dictionaries with column names as keys.
         """
+        # Bound once: the list is widened in place by __iter__, so it stays current
+        names = self._column_names
+        if reuse_row:
+            # Rows are padded to the current width, so widened columns are added as keys here
+            row_dict: dict[str, str] = {}
+            update = row_dict.update
+            for row in self:
+                update(zip(names, row, strict=False))
+                yield row_dict
+            return
+        width = -1
+        row_to_dict = _make_row_dict_builder(())
         for row in self:
-            yield dict(zip(self._column_names, row, strict=False))
+            if len(names) != width:
+                # Schema widened (or first row): switch to a builder for the new width
+                width = len(names)
+                row_to_dict = _make_row_dict_builder(tuple(names))
+            yield row_to_dict(row)
 
-    def iter_rows_as_tuples(self) -> Generator[tuple[str, ...], None, None]:
+    def iter_rows_as_tuples(self) -> Iterator[tuple[str, ...]]:
         """Iterate over rows as tuples.
 
-        Yields:
-            tuple[str, ...]: Rows as tuples of values.
+        Returns:
+            Iterator[tuple[str, ...]]: Iterator yielding rows as tuples of values.
         """
-        for row in self:
-            yield tuple(row)
+        return map(tuple, self)
 
     def clear_buffer(self) -> None:
         """Clear the current buffer to free memory.
 
         This method clears any buffered rows, allowing memory to be freed.
         Note that buffered rows will not be available for iteration after
-        calling this method.
+        calling this method. If the header has not been read yet it is read
+        first, so the rows buffered with it are discarded as well. Any
+        background prefetching is stopped.
+
+        Raises:
+            SplurgeTabularLookupError: If an ``intern_columns`` name is not a column.
         """
+        if not self._is_initialized:
+            self._initialize_from_stream()
+        self._stop_prefetch()
         self._buffer.clear()
 
     def reset_stream(self) -> None:
         """Reset the stream position.
 
-        This method clears the buffer and resets initialization state. Note that
+        This method clears the buffer like :meth:`clear_buffer`. Note that
         this does not actually reset the underlying stream iterator - you must
         provide a new stream iterator if you want to re-read from the beginning.
+        Column names already read from the stream are kept, so the header is
+        not read again.
+
+        Raises:
+            SplurgeTabularLookupError: If an ``intern_columns`` name is not a column.
         """
-        self._buffer.clear()
-        self._is_initialized = False
+        self.clear_buffer()
+
+
+class _ChunkPrefetcher:
+    """Background reader pulling chunks from a stream into a bounded queue.
+
+    The stream must not be read by anyone else until :meth:`close` returns.
+    """
+
+    # Seconds between checks of the stop flag while waiting on the queue
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, source: Iterator[list[list[str]]], depth: int) -> None:
+        """Start the producer thread.
+
+        Args:
+            source (Iterator[list[list[str]]]): Stream of chunks to read ahead.
+            depth (int): Maximum number of chunks held in the queue.
+        """
+        self._source = source
+        self._queue: queue.Queue[tuple[list[list[str]] | None, BaseException | None]] = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        # A chunk read from the source but not queued because the reader was stopped
+        self._unsent: list[list[list[str]]] = []
+        self._thread = threading.Thread(target=self._produce, name="splurge-tabular-prefetch", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: tuple[list[list[str]] | None, BaseException | None]) -> bool:
+        """Queue an item, giving up once the reader is stopped.
+
+        Args:
+            item (tuple[list[list[str]] | None, BaseException | None]): Chunk or end-of-stream/error marker.
+
+        Returns:
+            bool: True if the item was queued.
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        """Read the source into the queue, ending with an end-of-stream or error marker."""
+        try:
+            for chunk in self._source:
+                if not self._put((chunk, None)):
+                    self._unsent.append(chunk)
+                    return
+        except BaseException as exc:  # re-raised by the consumer
+            self._put((None, exc))
+            return
+        self._put((None, None))
+
+    def chunks(self) -> Generator[list[list[str]], None, None]:
+        """Yield queued chunks in stream order until the stream ends or the reader is stopped.
+
+        Yields:
+            list[list[str]]: Chunks in stream order.
+        """
+        stop = self._stop
+        get = self._queue.get
+        while not stop.is_set():
+            try:
+                chunk, error = get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if error is not None:
+                raise error
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self) -> list[list[list[str]]]:
+        """Stop and join the producer thread.
+
+        Returns:
+            list[list[list[str]]]: Chunks read from the source but never yielded, in stream order.
+        """
+        self._stop.set()
+        self._thread.join()
+        pending: list[list[list[str]]] = []
+        while True:
+            try:
+                chunk, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is not None:
+                pending.append(chunk)
+        pending.extend(self._unsent)
+        self._unsent.clear()
+        return pending
@@ -7,21 +7,37 @@ Please preserve this header and all related material when sharing!
 This module is licensed under the MIT License.
 """
 
-from collections.abc import Generator, Iterator
-from typing import Any
+import sys
+from collections.abc import Callable, Generator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 from ._vendor.splurge_typer.data_type import DataType
 from ._vendor.splurge_typer.string import String
 from ._vendor.splurge_typer.type_inference import TypeInference
 from .exceptions import (
+    SplurgeTabularError,
     SplurgeTabularLookupError,
     SplurgeTabularTypeError,
     SplurgeTabularValueError,
 )
-from .protocols import TabularDataProtocol
+from .protocols import RowFormat, TabularDataProtocol
+from .tabular_utils import make_row_dict_builder as _make_row_dict_builder
 from .tabular_utils import normalize_rows as _normalize_rows
 from .tabular_utils import process_headers as _process_headers
 
+if TYPE_CHECKING:
+    import numpy as np
+
+if sys.version_info >= (3, 11):
+    from operator import call as _call
+else:
+
+    def _call(func: Callable[[str], object], value: str) -> object:
+        return func(value)
+
 
 class TabularDataModel(TabularDataProtocol):
     """
@@ -31,12 +47,19 @@ class TabularDataModel(TabularDataProtocol):
     a consistent interface for tabular data operations.
     """
 
+    # Minimum table shape before infer_all_column_types() uses a thread pool
+    PARALLEL_INFERENCE_MIN_COLUMNS = 4
+    PARALLEL_INFERENCE_MIN_ROWS = 10_000
+
     def __init__(
         self,
         data: list[list[str]],
         *,
         header_rows: int = 1,
         skip_empty_rows: bool = True,
+        intern_columns: list[str] | None = None,
+        validate: bool = False,
+        type_sample_size: int | None = None,
     ) -> None:
         """Initialize TabularDataModel.
 
@@ -44,11 +67,21 @@ class TabularDataModel(TabularDataProtocol):
             data (list[list[str]]): Raw data rows.
             header_rows (int): Number of header rows to merge into column names.
             skip_empty_rows (bool): Skip empty rows in data.
+            intern_columns (list[str] | None): Names of low-cardinality columns whose
+                values are interned, so repeated values share one string object.
+            validate (bool): Check that every row is a list. By default only ``data``
+                itself and its first row are checked, which avoids a pass over all
+                rows for large inputs.
+            type_sample_size (int | None): Infer column types from at most this many
+                leading values, profiling the full column only when the sample is MIXED.
+                Faster on long columns, but a type that only appears later in the column
+                is missed. Defaults to profiling every value.
 
         Raises:
             SplurgeTabularValueError: If data is empty.
             SplurgeTabularTypeError: If header_rows is not an integer or data is not a list of lists.
-            SplurgeTabularValueError: If header_rows is negative.
+            SplurgeTabularValueError: If header_rows is negative or type_sample_size is less than 1.
+            SplurgeTabularLookupError: If a name in intern_columns is not a column.
         """
         if not data:
             raise SplurgeTabularValueError(
@@ -68,23 +101,37 @@ class TabularDataModel(TabularDataProtocol):
                 details={"param": "header_rows", "value": str(header_rows)},
             )
 
-        if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
+        if type_sample_size is not None and type_sample_size < 1:
+            raise SplurgeTabularValueError(
+                message=f"type_sample_size must be >= 1, got {type_sample_size}",
+                details={"param": "type_sample_size", "value": str(type_sample_size)},
+            )
+
+        if (
+            not isinstance(data, list)
+            or not isinstance(data[0], list)
+            or (validate and not all(map(isinstance, data, repeat(list))))
+        ):
             raise SplurgeTabularTypeError(
                 message="Data must be a list of lists",
                 details={"param": "data", "value": str(data)},
             )
 
         self._raw_data = data
+        self._type_sample_size = type_sample_size
         self._header_rows = header_rows
         self._header_data = data[:header_rows] if header_rows > 0 else []
-        self._data = (
+        rows = (
             self._normalize_data_model(data[header_rows:], skip_empty_rows)
             if header_rows > 0
             else self._normalize_data_model(data, skip_empty_rows)
         )
         self._header_columns = len(self._header_data[0]) if len(self._header_data) > 0 else 0
-        self._column_count = len(self._data[0]) if len(self._data) > 0 else 0
-        self._row_count = max(0, len(self._data))
+        # Column-major (SoA) store: one list per column, shared by all accessors.
+        # The column count is measured from the store; the row count is kept because
+        # zero-width rows leave no column to measure.
+        self._columns: list[list[str]] = self._transpose_rows(rows)
+        self._row_count = len(rows)
 
         # Process headers using shared utility
         self._header_data, self._column_names = _process_headers(
@@ -93,15 +140,29 @@ class TabularDataModel(TabularDataProtocol):
         )
 
         # Ensure column names match the actual column count
-        while len(self._column_names) < self._column_count:
-            self._column_names.append(f"column_{len(self._column_names)}")
+        while len(self._column_names) < len(self._columns):
+            self._column_names.append(sys.intern(f"column_{len(self._column_names)}"))
+        self._column_names_tuple: tuple[str, ...] = tuple(self._column_names)
         self._column_index_map = {name: i for i, name in enumerate(self._column_names)}
-        self._column_types: dict[str, DataType] = {}
+        if not rows:
+            # Header-only: one empty column per name, so column lookups return []
+            self._columns = [[] for _ in self._column_names]
+        for name in intern_columns or ():
+            col_idx = self.column_index(name)
+            if col_idx < len(self._columns):
+                self._columns[col_idx] = list(map(sys.intern, self._columns[col_idx]))
+        # Inferred type per column index, filled on first use
+        self._column_types: list[DataType | None] = [None] * len(self._columns)
+        self._typed_views: dict[tuple[frozenset[tuple[Any, type, Any]], bool], _TypedView] = {}
 
     @property
     def column_names(self) -> list[str]:
         """Get the list of column names.
 
+        The names are computed once at construction and the same list is
+        returned on every access (no defensive copy), so callers must treat
+        it as read-only.
+
         Returns:
             list[str]: List of column names in order.
         """
@@ -122,10 +183,13 @@ class TabularDataModel(TabularDataProtocol):
         Raises:
             SplurgeTabularLookupError: If column name is not found.
         """
-
-        if name not in self._column_names:
-            raise SplurgeTabularLookupError(message=f"Column name '{name}' not found", details={"column": name})
-        return self._column_index_map[name]
+        try:
+            return self._column_index_map[name]
+        except KeyError:
+            raise SplurgeTabularLookupError(
+                message=f"Column name '{name}' not found",
+                details={"column": name},
+            ) from None
 
     @property
     def row_count(self) -> int:
@@ -143,7 +207,8 @@ class TabularDataModel(TabularDataProtocol):
         Returns:
             int: Number of columns in the dataset.
         """
-        return self._column_count
+        # Header-only models keep empty columns for lookups but have no data columns
+        return len(self._columns) if self._row_count else 0
 
     def column_type(
         self,
@@ -160,20 +225,71 @@ class TabularDataModel(TabularDataProtocol):
         Raises:
             SplurgeTabularLookupError: If column name is not found.
         """
-        col_idx: int = self.column_index(name)
-        if name not in self._column_types:
-            values: list[str] = [row[col_idx] for row in self._data]
-            self._column_types[name] = TypeInference.profile_values(values)
-        return self._column_types[name]
+        col_idx = self.column_index(name)
+        data_type = self._column_types[col_idx]
+        if data_type is None:
+            data_type = self._profile_column(self._columns[col_idx])
+            self._column_types[col_idx] = data_type
+        return data_type
+
+    def _profile_column(self, values: list[str]) -> DataType:
+        """Infer a column's type, from a leading sample when ``type_sample_size`` is set.
+
+        Args:
+            values (list[str]): Values of one column.
+
+        Returns:
+            DataType: Inferred data type.
+        """
+        sample_size = self._type_sample_size
+        if sample_size is not None and len(values) > sample_size:
+            inferred = TypeInference.profile_values(values[:sample_size])
+            if inferred != DataType.MIXED:
+                return inferred
+        return TypeInference.profile_values(values)
+
+    def infer_all_column_types(self) -> dict[str, DataType]:
+        """Infer and cache the data type of every column.
+
+        Each column is profiled independently, so for tables with at least
+        ``PARALLEL_INFERENCE_MIN_COLUMNS`` columns and
+        ``PARALLEL_INFERENCE_MIN_ROWS`` rows the uncached columns are profiled
+        on a thread pool. Results share the cache used by :meth:`column_type`.
+
+        Returns:
+            dict[str, DataType]: Inferred data type for each column, in column order.
+        """
+        column_types = self._column_types
+        pending = [(i, values) for i, values in enumerate(self._columns) if column_types[i] is None]
+        if (
+            len(pending) > 1
+            and len(self._columns) >= self.PARALLEL_INFERENCE_MIN_COLUMNS
+            and self._row_count >= self.PARALLEL_INFERENCE_MIN_ROWS
+        ):
+            with ThreadPoolExecutor() as executor:
+                inferred = list(executor.map(self._profile_column, [values for _, values in pending]))
+        else:
+            inferred = [self._profile_column(values) for _, values in pending]
+
+        for (i, _), data_type in zip(pending, inferred, strict=True):
+            column_types[i] = data_type
+        return dict(zip(self._column_names_tuple, cast(list[DataType], column_types), strict=False))
 
     def column_values(
         self,
         name: str,
+        *,
+        copy: bool = False,
     ) -> list[str]:
         """Get all values for a column.
 
+        The column is stored contiguously, so by default the underlying list is
+        returned without copying. Callers must not mutate it; pass ``copy=True``
+        to receive an independent list.
+
         Args:
             name (str): Column name.
+            copy (bool): Return a copy of the column values instead of the stored list.
 
         Returns:
             list[str]: List of all values in the column.
@@ -182,7 +298,52 @@ class TabularDataModel(TabularDataProtocol):
             SplurgeTabularLookupError: If column name is not found.
         """
         col_idx: int = self.column_index(name)
-        return [row[col_idx] for row in self._data]
+        values = self._columns[col_idx]
+        return list(values) if copy else values
+
+    def column_values_as_array(
+        self,
+        name: str,
+        *,
+        dtype: Any = None,
+    ) -> "np.ndarray":
+        """Get all values for a column as a NumPy array.
+
+        Values are handed to NumPy in a single call, so with a numeric ``dtype``
+        (e.g. ``numpy.int64``) the strings are parsed by NumPy without creating
+        intermediate Python numbers, and the result supports vectorized
+        operations such as ``sum()``, ``min()`` and ``max()``.
+
+        Requires the optional ``numpy`` dependency (``pip install splurge-tabular[numpy]``).
+
+        Args:
+            name (str): Column name.
+            dtype (Any): NumPy dtype for the array. Defaults to ``object`` (the raw strings).
+
+        Returns:
+            numpy.ndarray: One-dimensional array of the column values.
+
+        Raises:
+            SplurgeTabularError: If NumPy is not installed.
+            SplurgeTabularLookupError: If column name is not found.
+            SplurgeTabularValueError: If the values cannot be converted to ``dtype``.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise SplurgeTabularError(
+                message="numpy is required for column_values_as_array",
+                details={"dependency": "numpy"},
+            ) from exc
+
+        values = self._columns[self.column_index(name)]
+        try:
+            return np.asarray(values, dtype=object if dtype is None else dtype)
+        except (TypeError, ValueError) as exc:
+            raise SplurgeTabularValueError(
+                message=f"Column '{name}' cannot be converted to {dtype}: {exc}",
+                details={"column": name, "dtype": str(dtype)},
+            ) from exc
 
     def cell_value(
         self,
@@ -209,33 +370,73 @@ class TabularDataModel(TabularDataProtocol):
                 message=f"Row index {row_index} out of range",
                 details={"index": str(row_index), "max_index": str(self.row_count - 1)},
             )
-        return self._data[row_index][col_idx]
+        return self._columns[col_idx][row_index]
 
     def __iter__(self) -> Iterator[list[str]]:
-        """Iterate over raw rows in the underlying data.
+        """Iterate over rows, assembled lazily from the column store.
 
-        Yields:
-            list[str]: Rows as lists of strings.
+        Returns:
+            Iterator[list[str]]: Iterator yielding rows as lists of strings.
         """
-        return iter(self._data)
+        return map(list, self._iter_row_tuples())
 
-    def iter_rows(self) -> Generator[dict[str, str], None, None]:
-        """Iterate over rows as dictionaries.
+    def __length_hint__(self) -> int:
+        """Return the number of rows, letting ``list(model)`` pre-size its result.
 
-        Yields:
-            dict[str, str]: Rows as dictionaries with column names as keys.
+        Returns:
+            int: Number of data rows.
         """
-        for row in self._data:
-            yield dict(zip(self._column_names, row, strict=False))
+        return self._row_count
+
+    @overload
+    def iter_rows(self, *, row_format: Literal["dict"] = ..., reuse_row: bool = ...) -> Iterator[dict[str, str]]: ...
 
-    def iter_rows_as_tuples(self) -> Generator[tuple[str, ...], None, None]:
+    @overload
+    def iter_rows(self, *, row_format: Literal["tuple"], reuse_row: bool = ...) -> Iterator[tuple[str, ...]]: ...
+
+    @overload
+    def iter_rows(self, *, row_format: Literal["list"], reuse_row: bool = ...) -> Iterator[list[str]]: ...
+
+    def iter_rows(
+        self, *, row_format: RowFormat = "dict", reuse_row: bool = False
+    ) -> Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+        """Iterate over rows in the requested format.
+
+        The format is resolved once, before iteration starts. ``"tuple"`` is the
+        cheapest form: rows come straight from the column store with no dict built.
+
+        Args:
+            row_format (RowFormat): ``"dict"`` (keyed by column name, the default),
+                ``"tuple"`` or ``"list"`` (positional values, see ``column_index``).
+            reuse_row (bool): For ``"dict"`` rows, yield the same dict object on every
+                step, updated in place. Callers must not keep a reference to a row
+                past the next iteration; copy it with ``dict(row)`` if needed.
+
+        Returns:
+            Iterator[dict[str, str]] | Iterator[tuple[str, ...]] | Iterator[list[str]]:
+                Iterator yielding rows in the requested format.
+
+        Raises:
+            SplurgeTabularValueError: If row_format is not a supported format.
+        """
+        if row_format == "dict":
+            return self._iter_row_dicts(reuse_row)
+        if row_format == "tuple":
+            return self._iter_row_tuples()
+        if row_format == "list":
+            return iter(self)
+        raise SplurgeTabularValueError(
+            message=f"Invalid row_format '{row_format}', expected 'dict', 'tuple' or 'list'",
+            details={"param": "row_format", "value": str(row_format)},
+        )
+
+    def iter_rows_as_tuples(self) -> Iterator[tuple[str, ...]]:
         """Iterate over rows as tuples.
 
-        Yields:
-            tuple[str, ...]: Rows as tuples of values.
+        Returns:
+            Iterator[tuple[str, ...]]: Iterator yielding rows as tuples of values.
         """
-        for row in self._data:
-            yield tuple(row)
+        return self._iter_row_tuples()
 
     def row(
         self,
@@ -257,10 +458,8 @@ class TabularDataModel(TabularDataProtocol):
                 message=f"Row index {index} out of range",
                 details={"index": str(index), "max_index": str(self.row_count - 1)},
             )
-        row_data = self._data[index]
-        # Ensure row_data is properly padded to match column count
-        padded_row = row_data + [""] * (self._column_count - len(row_data))
-        return {self._column_names[i]: padded_row[i] for i in range(self._column_count)}
+        # One pass over name/column pairs; no intermediate list of row values
+        return {name: col[index] for name, col in zip(self._column_names_tuple, self._columns, strict=False)}
 
     def row_as_list(
         self,
@@ -282,7 +481,7 @@ class TabularDataModel(TabularDataProtocol):
                 message=f"Row index {index} out of range",
                 details={"index": str(index), "max_index": str(self.row_count - 1)},
             )
-        return self._data[index]
+        return self._row_values(index)
 
     def row_as_tuple(
         self,
@@ -304,22 +503,114 @@ class TabularDataModel(TabularDataProtocol):
                 message=f"Row index {index} out of range",
                 details={"index": str(index), "max_index": str(self.row_count - 1)},
             )
-        return tuple(self._data[index])
+        return tuple(self._row_values(index))
 
     def to_typed(
         self,
         *,
         type_configs: dict[DataType, Any] | None = None,
+        cache_columns: bool = True,
     ) -> "_TypedView":
         """Return a typed view over this model.
 
+        Views are memoized per type configuration, so repeated calls with equal
+        ``type_configs`` return the same view and reuse its inferred types. The
+        model is treated as immutable after construction, so cached views never
+        need invalidating. Configurations with unhashable values are not cached.
+
         Args:
             type_configs (dict[DataType, Any] | None): Optional overrides for default type conversion behavior.
+            cache_columns (bool): Keep each converted column after the first
+                ``column_values`` call, trading memory for repeated access.
 
         Returns:
             _TypedView: A lightweight wrapper that provides typed access to the model.
         """
-        return _TypedView(self, type_configs=type_configs)
+        key = self._typed_view_key(type_configs)
+        if key is None:
+            return _TypedView(self, type_configs=type_configs, cache_columns=cache_columns)
+        view = self._typed_views.get((key, cache_columns))
+        if view is None:
+            view = self._typed_views[key, cache_columns] = _TypedView(
+                self, type_configs=type_configs, cache_columns=cache_columns
+            )
+        return view
+
+    @staticmethod
+    def _typed_view_key(type_configs: dict[DataType, Any] | None) -> frozenset[tuple[Any, type, Any]] | None:
+        """Build a hashable cache key for a typed view configuration.
+
+        Args:
+            type_configs (dict[DataType, Any] | None): Type conversion overrides.
+
+        Returns:
+            frozenset[tuple[Any, type, Any]] | None: Cache key, or None if the configuration is unhashable.
+        """
+        if not type_configs:
+            return frozenset()
+        try:
+            # Include the value type so e.g. 1 and True do not share a view
+            return frozenset((dt, type(value), value) for dt, value in type_configs.items())
+        except TypeError:
+            return None
+
+    def _row_values(self, index: int) -> list[str]:
+        """Gather one row's values from the column store.
+
+        A list comprehension measured faster here than both a generator fed to
+        ``tuple()`` and ``map(operator.itemgetter(index), columns)``.
+
+        Args:
+            index (int): Zero-based row index (assumed to be in range).
+
+        Returns:
+            list[str]: New list of the row's values in column order.
+        """
+        return [col[index] for col in self._columns]
+
+    def _iter_row_dicts(self, reuse_row: bool = False) -> Generator[dict[str, str], None, None]:
+        """Iterate over rows as dictionaries keyed by column name.
+
+        Args:
+            reuse_row (bool): Yield one dict, updated in place, instead of a new dict per row.
+
+        Yields:
+            dict[str, str]: Rows as dictionaries with column names as keys.
+        """
+        # Rows are as wide as the column store, which may be narrower than the header
+        names = self._column_names_tuple[: len(self._columns)]
+        if reuse_row:
+            # Keys are inserted once; each step only overwrites the values
+            row_dict = dict.fromkeys(names, "")
+            update = row_dict.update
+            for row in self._iter_row_tuples():
+                update(zip(names, row, strict=False))
+                yield row_dict
+            return
+        yield from map(_make_row_dict_builder(names), self._iter_row_tuples())
+
+    def _iter_row_tuples(self) -> Iterator[tuple[str, ...]]:
+        """Iterate over rows as tuples by zipping the column store.
+
+        Returns:
+            Iterator[tuple[str, ...]]: Iterator yielding one tuple per data row.
+        """
+        if not self._columns:
+            # Zero-width rows (e.g. kept empty rows) cannot be recovered from zip()
+            return iter([()] * self._row_count)
+        return zip(*self._columns, strict=False)
+
+    @staticmethod
+    def _transpose_rows(rows: list[list[str]]) -> list[list[str]]:
+        """Transpose normalized, equal-width rows into per-column lists.
+
+        Args:
+            rows (list[list[str]]): Normalized data rows.
+
+        Returns:
+            list[list[str]]: One list of values per column.
+        """
+        return [list(col) for col in zip(*rows, strict=False)]
 
     @staticmethod
     def _normalize_data_model(
@@ -344,22 +635,34 @@ class _TypedView:
     Performs lazy per-cell conversions using the model's inferred column types.
     """
 
+    # Distinct strings whose empty/none-like classification is cached
+    VALUE_KIND_CACHE_MAX_SIZE = 100_000
+
+    # Classifications stored in the value-kind cache
+    _KIND_VALUE = 0
+    _KIND_NONE = 1
+    _KIND_EMPTY = 2
+
+    # Stripped, lower-cased strings that String.is_none_like accepts
+    _NONE_LIKE_VALUES = frozenset({"none", "null"})
+
     def __init__(
         self,
         model: TabularDataModel,
         *,
         type_configs: dict[DataType, Any] | None = None,
+        cache_columns: bool = True,
     ) -> None:
         """Initialize the typed view.
 
         Args:
             model: The tabular data model to wrap.
             type_configs: Optional type-specific configuration overrides.
+            cache_columns: Keep converted columns returned by ``column_values``.
         """
-        from ._vendor.splurge_typer.string import String  # local import to avoid cycles
-
         self._model = model
-        self._string = String
+        # Converted columns by index, when cache_columns is set
+        self._typed_columns: dict[int, list[object]] | None = {} if cache_columns else None
         # Defaults mirror previous TypedTabularDataModel semantics (empty vs none)
         self._type_defaults: dict[DataType, dict[str, Any]] = {
             DataType.BOOLEAN: {"empty": False, "none": False},
@@ -387,6 +690,20 @@ class _TypedView:
                 else:
                     self._type_defaults[dt]["empty"] = override_value
 
+        # Inferred types, by column name and (once every column is typed) by index
+        self._typed_column_types: dict[str, DataType] = {}
+        self._col_dtypes: list[DataType] | None = None
+        self._col_converters: list[Callable[[str], object]] | None = None
+
+        # Empty/none-like classification per distinct string, shared by all columns
+        self._value_kinds: dict[str, int] = {}
+
+        # One converter per DataType with its defaults and parser bound in
+        self._converters: dict[DataType, Callable[[str], object]] = {
+            dt: self._make_converter(dt, defaults["empty"], defaults["none"])
+            for dt, defaults in self._type_defaults.items()
+        }
+
     @property
     def column_names(self) -> list[str]:
         """Get the list of column names.
@@ -434,8 +751,10 @@ class _TypedView:
         Yields:
             list[object]: Rows as lists of converted values.
         """
-        for row in self._model:
-            yield [self._convert(value, self._inferred_type(i)) for i, value in enumerate(row)]
+        converters = self._column_converters()
+        # Raw rows come straight from the column store as tuples, with no list built per row
+        for row in self._model._iter_row_tuples():
+            yield list(map(_call, converters, row))
 
     def iter_rows(self) -> Generator[dict[str, object], None, None]:
         """Iterate over rows as dictionaries with type conversion.
@@ -443,8 +762,13 @@ class _TypedView:
         Yields:
             dict[str, object]: Rows as dictionaries with column names as keys.
         """
-        for row in self:
-            yield dict(zip(self.column_names, row, strict=False))
+        model = self._model
+        # The generated builder only indexes rows, so it works for typed values too
+        row_to_dict = cast(
+            Callable[[Sequence[object]], dict[str, object]],
+            _make_row_dict_builder(model._column_names_tuple[: len(model._columns)]),
+        )
+        yield from map(row_to_dict, self)
 
     def iter_rows_as_tuples(self) -> Generator[tuple[object, ...], None, None]:
         """Iterate over rows as tuples with type conversion.
@@ -452,14 +776,20 @@ class _TypedView:
         Yields:
             tuple[object, ...]: Rows as tuples of converted values.
         """
-        for row in self:
-            yield tuple(row)
+        converters = self._column_converters()
+        for row in self._model._iter_row_tuples():
+            yield tuple(map(_call, converters, row))
 
-    def column_values(self, name: str) -> list[object]:
+    def column_values(self, name: str, *, copy: bool = False) -> list[object]:
         """Get all values for a column with type conversion.
 
+        When the view caches columns, the converted list is kept and returned
+        again on later calls. Callers must not mutate it; pass ``copy=True`` to
+        receive an independent list.
+
         Args:
             name (str): Column name.
+            copy (bool): Return a copy of the converted values instead of the cached list.
 
         Returns:
             list[object]: List of converted values.
@@ -468,8 +798,14 @@ class _TypedView:
             SplurgeTabularLookupError: If column name is not found.
         """
         col_idx = self._model.column_index(name)
-        dtype = self._inferred_type(col_idx)
-        return [self._convert(v, dtype) for v in self._model.column_values(name)]
+        cache = self._typed_columns
+        values = cache.get(col_idx) if cache is not None else None
+        if values is None:
+            values = self._convert_column(self._model._columns[col_idx], self._inferred_type(col_idx))
+            if cache is None:
+                return values
+            cache[col_idx] = values
+        return list(values) if copy else values
 
     def cell_value(self, name: str, row_index: int) -> object:
         """Get a specific cell value with type conversion.
@@ -485,10 +821,14 @@ class _TypedView:
             SplurgeTabularLookupError: If column name is not found.
             SplurgeTabularLookupError: If row index is out of range.
         """
-        col_idx = self._model.column_index(name)
-        dtype = self._inferred_type(col_idx)
-        raw = self._model.cell_value(name, row_index)
-        return self._convert(raw, dtype)
+        model = self._model
+        col_idx = model.column_index(name)
+        if row_index < 0 or row_index >= model._row_count:
+            raise SplurgeTabularLookupError(
+                message=f"Row index {row_index} out of range",
+                details={"index": str(row_index), "max_index": str(model._row_count - 1)},
+            )
+        return self._convert(model._columns[col_idx][row_index], self._inferred_type(col_idx))
 
     def row(self, index: int) -> dict[str, object]:
         """Get a typed row as a dictionary.
@@ -502,8 +842,7 @@ class _TypedView:
         Raises:
             SplurgeTabularLookupError: If row index is out of range.
         """
-        typed_list = self.row_as_list(index)
-        return {self.column_names[i]: typed_list[i] for i in range(self.column_count)}
+        return dict(zip(self._model._column_names_tuple, self.row_as_list(index), strict=False))
 
     def row_as_list(self, index: int) -> list[object]:
         """Get a typed row as a list.
@@ -522,8 +861,8 @@ class _TypedView:
                 message=f"Row index {index} out of range",
                 details={"index": str(index), "max_index": str(self._model.row_count - 1)},
             )
-        raw = self._model.row_as_list(index)
-        return [self._convert(val, self._inferred_type(i)) for i, val in enumerate(raw)]
+        raw = self._model._row_values(index)
+        return [convert(value) for convert, value in zip(self._column_converters(), raw, strict=False)]
 
     def row_as_tuple(self, index: int) -> tuple[object, ...]:
         """Get a typed row as a tuple.
@@ -551,8 +890,30 @@ class _TypedView:
         Returns:
             DataType: Inferred data type for the specified column.
         """
-        name = self.column_names[col_index]
-        return self.column_type(name)
+        return self.column_type(self._model._column_names[col_index])
+
+    def _column_dtypes(self) -> list[DataType]:
+        """Get the inferred DataType of every column, indexed by column position.
+
+        The list is built on first use, inferring any column types not yet cached.
+
+        Returns:
+            list[DataType]: Inferred data type per column index.
+        """
+        if self._col_dtypes is None:
+            self._col_dtypes = [self._inferred_type(i) for i in range(len(self._model._columns))]
+        return self._col_dtypes
+
+    def _column_converters(self) -> list[Callable[[str], object]]:
+        """Get the converter for every column, indexed by column position.
+
+        Returns:
+            list[Callable[[str], object]]: Converter per column index.
+        """
+        if self._col_converters is None:
+            converters = self._converters
+            self._col_converters = [converters[dtype] for dtype in self._column_dtypes()]
+        return self._col_converters
 
     def _convert(self, value: str, dtype: DataType) -> object:
         """Convert a raw string value to a Python value based on DataType.
@@ -568,37 +929,137 @@ class _TypedView:
         Returns:
             object: Converted Python value (type depends on `dtype`).
         """
-        from ._vendor.splurge_typer.string import String
+        return self._converters[dtype](value)
+
+    def _convert_column(self, values: list[str], dtype: DataType) -> list[object]:
+        """Convert a whole column of raw strings to Python values.
+
+        The converter for ``dtype`` is looked up once for the column rather
+        than once per cell.
+
+        Args:
+            values (list[str]): Raw string values of one column.
+            dtype (DataType): The DataType to convert to.
+
+        Returns:
+            list[object]: Converted Python values, in the same order.
+        """
+        return list(map(self._converters[dtype], values))
 
-        defaults = self._type_defaults.get(dtype, {"empty": None, "none": None})
-        empty_default = defaults["empty"]
-        none_default = defaults["none"]
+    def _make_converter(self, dtype: DataType, empty_default: Any, none_default: Any) -> Callable[[str], object]:
+        """Build the single-value converter for a DataType.
 
-        if dtype == DataType.MIXED:
-            if String.is_none_like(value):
+        Repeated strings are classified as empty-like or none-like once, through
+        the view's value-kind cache.
+
+        Args:
+            dtype (DataType): The DataType to convert to.
+            empty_default (Any): Value returned for empty-like strings.
+            none_default (Any): Value returned for none-like strings.
+
+        Returns:
+            Callable[[str], object]: Converter taking a raw string.
+        """
+        value_kind = self._value_kind
+        cached_kind = self._value_kinds.get
+        kind_none = self._KIND_NONE
+        kind_empty = self._KIND_EMPTY
+        parse = self._value_parser(dtype, empty_default)
+
+        if parse is None:
+
+            def convert_string(value: str) -> object:
+                kind = cached_kind(value)
+                if kind is None:
+                    kind = value_kind(value)
+                if kind == kind_none:
+                    return none_default
+                if kind == kind_empty:
+                    return empty_default
+                return value
+
+            return convert_string
+
+        def convert(value: str) -> object:
+            kind = cached_kind(value)
+            if kind is None:
+                kind = value_kind(value)
+            if kind == kind_none:
                 return none_default
-            if String.is_empty_like(value):
+            if kind == kind_empty:
                 return empty_default
-            return value
+            return parse(value)
+
+        return convert
+
+    def _value_kind(self, value: str) -> int:
+        """Classify a raw string as none-like, empty-like or a regular value (cached).
+
+        At most ``VALUE_KIND_CACHE_MAX_SIZE`` distinct strings are cached; further
+        new strings are classified on every call.
 
-        if String.is_none_like(value):
-            return none_default
-        if String.is_empty_like(value):
-            return empty_default
+        Args:
+            value (str): Raw string value from the dataset.
+
+        Returns:
+            int: ``_KIND_NONE``, ``_KIND_EMPTY`` or ``_KIND_VALUE``.
+        """
+        kinds = self._value_kinds
+        kind = kinds.get(value)
+        if kind is None:
+            # Same rules as String.is_none_like / is_empty_like, with a single strip
+            stripped = value.strip()
+            if not stripped:
+                kind = self._KIND_EMPTY
+            elif stripped.lower() in self._NONE_LIKE_VALUES:
+                kind = self._KIND_NONE
+            else:
+                kind = self._KIND_VALUE
+            if len(kinds) < self.VALUE_KIND_CACHE_MAX_SIZE:
+                kinds[value] = kind
+        return kind
+
+    @staticmethod
+    def _value_parser(dtype: DataType, empty_default: Any) -> Callable[[str], object] | None:
+        """Get the parser for non-empty, non-none values of a DataType.
+
+        Args:
+            dtype (DataType): The DataType to convert to.
+            empty_default (Any): Configured empty default, also used when parsing fails.
 
+        Returns:
+            Callable[[str], object] | None: Parser taking a raw string, or ``None`` when
+            values of ``dtype`` are kept as strings.
+        """
         if dtype == DataType.BOOLEAN:
-            return String.to_bool(value, default=bool(empty_default))
+            return partial(String.to_bool, default=bool(empty_default))
         if dtype == DataType.INTEGER:
-            return String.to_int(value, default=int(empty_default or 0))
+            to_int = partial(String.to_int, default=int(empty_default or 0))
+
+            def parse_int(value: str) -> object:
+                # Plain ASCII digits skip the regex check; signs and padding fall back
+                if value.isascii() and value.isdigit():
+                    return int(value)
+                return to_int(value)
+
+            return parse_int
         if dtype == DataType.FLOAT:
-            return String.to_float(value, default=float(empty_default or 0.0))
+            to_float = partial(String.to_float, default=float(empty_default or 0.0))
+
+            def parse_float(value: str) -> object:
+                # Unsigned ASCII decimals ("12", "1.5", ".5", "5.") skip the regex check
+                if value.isascii() and value.replace(".", "", 1).isdigit():
+                    return float(value)
+                return to_float(value)
+
+            return parse_float
         if dtype == DataType.DATE:
-            return String.to_date(value, default=empty_default)
+            return partial(String.to_date, default=empty_default)
         if dtype == DataType.DATETIME:
-            return String.to_datetime(value, default=empty_default)
+            return partial(String.to_datetime, default=empty_default)
         if dtype == DataType.TIME:
-            return String.to_time(value, default=empty_default)
-        return value
+            return partial(String.to_time, default=empty_default)
+        return None
 
     def column_type(self, name: str) -> DataType:
         """Infer and cache column type, preferring non-empty/none-like values.
@@ -615,20 +1076,27 @@ class _TypedView:
         Raises:
             SplurgeTabularLookupError: If column name is not found.
         """
-
-        # Lazy cache on the wrapper to avoid recomputation
-        if not hasattr(self, "_typed_column_types"):
-            self._typed_column_types: dict[str, DataType] = {}
-
         if name in self._typed_column_types:
             return self._typed_column_types[name]
 
         values: list[str] = self._model.column_values(name)
 
-        non_empty_values: list[str] = [v for v in values if not String.is_empty_like(v) and not String.is_none_like(v)]
+        value_kind = self._value_kind
+        kind_value = self._KIND_VALUE
+        sample_size = self._model._type_sample_size
+        if sample_size is not None and len(values) > sample_size:
+            sample = list(islice((v for v in values if value_kind(v) == kind_value), sample_size))
+            if sample:
+                inferred = TypeInference.profile_values(sample)
+                if inferred != DataType.MIXED:
+                    self._typed_column_types[name] = inferred
+                    return inferred
+
+        non_empty_values: list[str] = [v for v in values if value_kind(v) == kind_value]
         if non_empty_values:
             inferred = TypeInference.profile_values(non_empty_values)
-            if inferred != DataType.MIXED:
+            # With nothing filtered out, profiling all values would repeat the same pass
+            if inferred != DataType.MIXED or len(non_empty_values) == len(values):
                 self._typed_column_types[name] = inferred
                 return inferred
 
@@ -13,6 +13,13 @@ This module is licensed under the MIT License.
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from itertools import filterfalse
+
+# Widest row for which make_row_dict_builder() generates a specialized function
+ROW_DICT_CODEGEN_MAX_COLUMNS = 32
 
 
 def process_headers(
@@ -22,6 +29,9 @@ def process_headers(
 ) -> tuple[list[list[str]], list[str]]:
     """Process header rows and return processed header data and column names.
 
+    Column names are interned so that the many row dicts keyed by them share
+    one string object per name.
+
     Args:
         header_data (list[list[str]]): Raw header data rows.
         header_rows (int): Number of header rows to merge.
@@ -56,7 +66,7 @@ def process_headers(
     while len(column_names) < column_count:
         column_names.append(f"column_{len(column_names)}")
 
-    return processed_header_data, column_names
+    return processed_header_data, [sys.intern(name) for name in column_names]
 
 
 def normalize_rows(
@@ -76,7 +86,7 @@ def normalize_rows(
     if not rows:
         return []
 
-    max_columns = max(len(row) for row in rows)
+    max_columns = max(map(len, rows))
     normalized: list[list[str]] = []
     for row in rows:
         if len(row) < max_columns:
@@ -84,7 +94,7 @@ def normalize_rows(
         normalized.append(row)
 
     if skip_empty_rows:
-        normalized = [row for row in normalized if not should_skip_row(row)]
+        normalized = list(filterfalse(should_skip_row, normalized))
 
     return normalized
 
@@ -98,7 +108,11 @@ def should_skip_row(row: list[str]) -> bool:
     Returns:
         bool: True if the row is empty or contains only whitespace.
     """
-    return all(cell.strip() == "" for cell in row)
+    # Returns on the first non-blank cell, which is usually the first cell
+    for cell in row:
+        if cell and not cell.isspace():
+            return False
+    return True
 
 
 def auto_column_names(count: int) -> list[str]:
@@ -111,3 +125,39 @@ def auto_column_names(count: int) -> list[str]:
         list[str]: List of default column names in format ``"column_0"``, ``"column_1"``, etc.
     """
     return [f"column_{i}" for i in range(count)]
+
+
+@lru_cache(maxsize=128)
+def make_row_dict_builder(column_names: tuple[str, ...]) -> Callable[[Sequence[str]], dict[str, str]]:
+    """Return a function that converts a row into a dictionary keyed by column name.
+
+    For up to ``ROW_DICT_CODEGEN_MAX_COLUMNS`` columns a function specialized to
+    the column count is generated, building the dictionary from a literal
+    display (``{k0: row[0], k1: row[1], ...}``) with the names bound as default
+    arguments. This avoids creating a ``zip`` iterator per row. Wider schemas
+    fall back to ``dict(zip(...))``. Builders are cached per column-name tuple.
+
+    Column names are never interpolated into generated source; only positional
+    indices are.
+
+    Args:
+        column_names (tuple[str, ...]): Column names in order.
+
+    Returns:
+        Callable[[Sequence[str]], dict[str, str]]: Row-to-dictionary converter. Rows
+        must have at least ``len(column_names)`` values.
+    """
+    if len(column_names) > ROW_DICT_CODEGEN_MAX_COLUMNS:
+
+        def row_to_dict(row: Sequence[str]) -> dict[str, str]:
+            return dict(zip(column_names, row, strict=False))
+
+        return row_to_dict
+
+    params = "".join(f", _k{i}=_names[{i}]" for i in range(len(column_names)))
+    items = ", ".join(f"_k{i}: row[{i}]" for i in range(len(column_names)))
+    source = f"def row_to_dict(row{params}):\n    return {{{items}}}\n"
+    namespace: dict[str, object] = {"_names": column_names}
+    exec(source, namespace)
+    builder: Callable[[Sequence[str]], dict[str, str]] = namespace["row_to_dict"]  # type: ignore[assignment]
+    return builder
@@ -4,10 +4,16 @@ These tests validate complete workflows and data processing pipelines
 from start to finish, ensuring the package works correctly in real-world scenarios.
 """
 
+import csv
+import functools
+import io
 import json
-import tempfile
+from collections.abc import Callable, Iterator
+from operator import itemgetter
 from pathlib import Path
 
+import pytest
+
 from splurge_tabular import (
     SplurgeTabularError,
     SplurgeTabularLookupError,
@@ -24,95 +30,103 @@ from splurge_tabular import (
 from splurge_tabular._vendor.splurge_typer.data_type import DataType
 
 
-class TestEndToEndWorkflows:
-    """Test complete data processing workflows."""
+def _parse_csv_text(text: str) -> tuple[list[str], list[list[str]]]:
+    """Parse CSV text into a header row and data rows, dropping blank lines."""
+    reader = csv.reader(io.StringIO(text))
+    headers = next(reader)
+    return headers, [row for row in reader if row]
 
-    def test_csv_file_processing_pipeline(self) -> None:
-        """Test complete CSV file processing from file to processed data."""
-        # Create test CSV data
-        csv_data = """name,age,city
+
+# The same records as CSV and JSON, for the file processing pipeline cases
+_PIPELINE_CSV = """name,age,city
 John,25,New York
 Jane,30,London
 Bob,35,Paris"""
+_PIPELINE_JSON = json.dumps(
+    [
+        {"name": "John", "age": 25, "city": "New York"},
+        {"name": "Jane", "age": 30, "city": "London"},
+        {"name": "Bob", "age": 35, "city": "Paris"},
+    ]
+)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            f.write(csv_data)
-            csv_path = f.name
 
-        try:
-            # Process file through complete pipeline
-            result = Path(csv_path).read_text()
-
-            # Parse CSV (simplified parsing for test)
-            lines = result.split("\n")
-            headers = lines[0].split(",")
-            rows = [line.split(",") for line in lines[1:] if line.strip()]
-
-            # Process headers
-            processed_header_data, _column_names = process_headers([headers], header_rows=1)
-            # Normalize rows
-            normalized_rows = normalize_rows(rows, skip_empty_rows=True)
-
-            # Ensure minimum columns
-            ensure_minimum_columns(normalized_rows, 2)
-
-            # Create data model
-            model = TabularDataModel([processed_header_data[0]] + normalized_rows)
-            # Validate final result
-            assert len(model.column_names) == 3
-            assert model.row_count == 3
-            assert model.column_names == ["name", "age", "city"]
-            assert list(model)[0] == ["John", "25", "New York"]
-
-        finally:
-            Path(csv_path).unlink()
-
-    def test_json_file_processing_pipeline(self) -> None:
-        """Test complete JSON file processing pipeline."""
-        json_data = [
-            {"name": "John", "age": 25, "city": "New York"},
-            {"name": "Jane", "age": 30, "city": "London"},
-            {"name": "Bob", "age": 35, "city": "Paris"},
-        ]
+# Shared by the empty-row workflow cases; models do not modify their input
+_EMPTY_ROW_DATA = [
+    ["Name", "Age"],
+    ["Alice", "28"],
+    ["", ""],  # Empty row
+    ["Bob", "35"],
+]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(json_data, f)
-            json_path = f.name
 
-        try:
-            # Read and parse JSON
-            result = json.loads(Path(json_path).read_text())
+def _to_csv_text(rows: list[list[str]]) -> str:
+    """Write rows as CSV text in one writerows call."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
 
-            # Convert to tabular format
-            if isinstance(result, list) and result:
-                headers = list(result[0].keys())
-                rows = [[str(item.get(h, "")) for h in headers] for item in result]
+@functools.cache
+def _large_rows(n_rows: int, n_cols: int) -> list[list[str]]:
+    """Build synthetic rows once per shape; callers must not mutate them."""
+    col_suffixes = [f"_col_{col}" for col in range(n_cols)]
+    row_prefixes = (f"row_{row}" for row in range(n_rows))
+    return [[prefix + suffix for suffix in col_suffixes] for prefix in row_prefixes]
 
-                # Process through pipeline
-                processed_header_data, column_names = process_headers([headers], header_rows=1)
-                normalized_rows = normalize_rows(rows, skip_empty_rows=True)
-                ensure_minimum_columns(normalized_rows, 2)
 
-                model = TabularDataModel([processed_header_data[0]] + normalized_rows)
+def _chunked_stream(headers: list[str], rows: list[list[str]], size: int = 1000) -> Iterator[list[list[str]]]:
+    """Yield the header and rows as a stream of chunks of at most ``size`` data rows."""
+    yield [headers] + rows[:size]
+    for start in range(size, len(rows), size):
+        yield rows[start : start + size]
 
-                assert len(model.column_names) == 3
-                assert model.row_count == 3
-                assert model.column_names == ["name", "age", "city"]
 
-        finally:
-            Path(json_path).unlink()
+class TestEndToEndWorkflows:
+    """Test complete data processing workflows."""
+
+    @pytest.mark.parametrize("fmt", ["csv", "json"])
+    def test_file_processing_pipeline(self, fmt: str) -> None:
+        """Test complete CSV and JSON processing from raw text to processed data."""
+        # Only the parse step depends on the format
+        if fmt == "csv":
+            headers, rows = _parse_csv_text(_PIPELINE_CSV)
+        else:
+            # Read and parse JSON straight from a file object
+            result = json.load(io.StringIO(_PIPELINE_JSON))
+            assert isinstance(result, list) and result
+            # Every record has the keys of the first one
+            headers = list(result[0].keys())
+            get_fields = itemgetter(*headers)
+            rows = [[str(value) for value in get_fields(item)] for item in result]
+
+        # Process headers
+        processed_header_data, _column_names = process_headers([headers], header_rows=1)
+        # Normalize rows
+        normalized_rows = normalize_rows(rows, skip_empty_rows=True)
+
+        # Ensure minimum columns
+        ensure_minimum_columns(normalized_rows, 2)
+
+        # Create data model
+        # normalize_rows returned a new list, so the header can go in place
+        normalized_rows.insert(0, processed_header_data[0])
+        model = TabularDataModel(normalized_rows)
+        # Validate final result
+        assert len(model.column_names) == 3
+        assert model.row_count == 3
+        assert model.column_names == ["name", "age", "city"]
+        assert model.row_as_list(0) == ["John", "25", "New York"]
 
     def test_large_dataset_streaming_processing(self) -> None:
         """Test processing of large datasets using streaming model."""
         # Create large dataset
         headers = ["col1", "col2", "col3", "col4", "col5"]
-        large_rows = [
-            [f"row{i}_val{j}" for j in range(5)]
-            for i in range(1000)  # 1000 rows
-        ]
+        # Rows shared by both streams; the models do not modify them
+        rows = _large_rows(1000, 5)
 
-        # Process with streaming model
-        data_stream = iter([[headers] + large_rows])
+        # Process with streaming model, fed in chunks as a real source would
+        data_stream = _chunked_stream(headers, rows, size=250)
         streaming_model = StreamingTabularDataModel(data_stream)
 
         # Validate streaming iteration
@@ -125,12 +139,13 @@ Bob,35,Paris"""
 
         # Test dict iteration
         # Create new streaming model for dict iteration
-        data_stream2 = iter([[headers] + large_rows])
+        data_stream2 = _chunked_stream(headers, rows, size=250)
         streaming_model2 = StreamingTabularDataModel(data_stream2)
+        headers_set = frozenset(headers)
         dict_count = 0
         for row_dict in streaming_model2.iter_rows():
             assert isinstance(row_dict, dict)
-            assert set(row_dict.keys()) == set(headers)
+            assert row_dict.keys() == headers_set
             dict_count += 1
 
         assert dict_count == 1000
@@ -161,11 +176,12 @@ Bob,35,Paris"""
         assert typed_model.column_type("Salary") == DataType.FLOAT
         assert typed_model.column_type("Active") == DataType.BOOLEAN
 
-        # Verify typed access
-        for row in typed_model.iter_rows():
-            assert isinstance(row["Age"], int)
-            assert isinstance(row["Salary"], float)
-            assert isinstance(row["Active"], bool)
+        # Verify typed access; inferred types apply to the whole column
+        rows = list(typed_model.iter_rows())
+        assert len(rows) == 2
+        check_keys = ("Age", "Salary", "Active")
+        expected_types = (int, float, bool)
+        assert tuple(type(rows[0][key]) for key in check_keys) == expected_types
 
     def test_multiple_header_rows_workflow(self) -> None:
         """Test processing data with multiple header rows."""
@@ -187,22 +203,11 @@ Bob,35,Paris"""
             "Salary": "75000",
         }
 
-    def test_empty_row_handling_workflow(self) -> None:
+    @pytest.mark.parametrize(("skip_empty_rows", "expected_rows"), [(True, 2), (False, 3)])
+    def test_empty_row_handling_workflow(self, skip_empty_rows: bool, expected_rows: int) -> None:
         """Test empty row handling in complete workflow."""
-        data = [
-            ["Name", "Age"],
-            ["Alice", "28"],
-            ["", ""],  # Empty row
-            ["Bob", "35"],
-        ]
-
-        # Test skipping empty rows
-        model_skip = TabularDataModel(data, skip_empty_rows=True)
-        assert model_skip.row_count == 2
-
-        # Test preserving empty rows
-        model_keep = TabularDataModel(data, skip_empty_rows=False)
-        assert model_keep.row_count == 3
+        model = TabularDataModel(_EMPTY_ROW_DATA, skip_empty_rows=skip_empty_rows)
+        assert model.row_count == expected_rows
 
     def test_comprehensive_exception_handling_workflow(self) -> None:
         """Test exception handling in complete workflows."""
@@ -253,10 +258,10 @@ Bob,35,Paris"""
         first_read = list(model1)
         assert len(first_read) == 2
 
-        # Reset clears buffer and resets state, but requires new iterator to re-read
+        # Reset clears the buffer and keeps the header, but requires new iterator to re-read
         model1.reset_stream()
         assert len(model1._buffer) == 0  # Buffer cleared
-        assert not model1._is_initialized  # State reset
+        assert model1.column_names == ["name", "age"]  # Header kept
 
         # Create new model with new iterator to simulate re-reading
         model2 = StreamingTabularDataModel(create_stream())
@@ -291,7 +296,7 @@ Bob,35,Paris"""
 
         model = TabularDataModel(data)
         assert model.column_names == ["姓名", "年齢", "都市"]
-        assert model.cell_value("姓名", 0) == "アリス"
+        assert model.row_as_list(0) == ["アリス", "28", "東京"]
 
     def test_type_inference_complete_workflow(self) -> None:
         """Test complete type inference workflow."""
@@ -351,8 +356,9 @@ Bob,35,Paris"""
         ]
 
         # Create both models
-        memory_model = TabularDataModel([headers] + rows)
-        data_stream = iter([[headers] + rows])
+        data = [headers] + rows
+        memory_model = TabularDataModel(data)
+        data_stream = iter([data])
         streaming_model = StreamingTabularDataModel(data_stream)
 
         # Compare basic properties
@@ -363,20 +369,16 @@ Bob,35,Paris"""
         memory_rows = list(memory_model)
         streaming_rows = list(streaming_model)
 
-        assert len(memory_rows) == len(streaming_rows)
-        for mem_row, stream_row in zip(memory_rows, streaming_rows, strict=False):
-            assert mem_row == stream_row
+        assert memory_rows == streaming_rows
 
         # Test dict iteration consistency
         memory_dicts = list(memory_model.iter_rows())
         # Create new streaming model for dict iteration
-        data_stream2 = iter([[headers] + rows])
+        data_stream2 = iter([data])
         streaming_model2 = StreamingTabularDataModel(data_stream2)
         streaming_dicts = list(streaming_model2.iter_rows())
 
-        assert len(memory_dicts) == len(streaming_dicts)
-        for mem_dict, stream_dict in zip(memory_dicts, streaming_dicts, strict=False):
-            assert mem_dict == stream_dict
+        assert memory_dicts == streaming_dicts
 
     def test_data_transformation_pipeline(self) -> None:
         """Test complete data transformation pipeline."""
@@ -388,7 +390,7 @@ Bob,35,Paris"""
             ["bob johnson", "", "paris"],  # Missing age
         ]
 
-        headers = [h.lower() for h in raw_data[0]]
+        headers = list(map(str.lower, raw_data[0]))
         rows = raw_data[1:]
 
         # Process through normalization
@@ -419,9 +421,7 @@ Widget B,29.99,Tools
 Widget C,9.99,Books"""
 
         # Parse CSV
-        lines = csv_data.strip().split("\n")
-        headers = lines[0].split(",")
-        rows = [line.split(",") for line in lines[1:]]
+        headers, rows = _parse_csv_text(csv_data)
 
         # Create model
         model = TabularDataModel([headers] + rows)
@@ -441,77 +441,56 @@ Widget C,9.99,Books"""
 
     def test_batch_processing_workflow(self) -> None:
         """Test processing multiple files in batch."""
-        # Create multiple test files
-        test_files = []
-        base_data = [
-            ["id", "value"],
-            ["1", "100"],
-            ["2", "200"],
-        ]
+        # Values for each document, as (first row, second row)
+        values = [(str(100 * k), str(200 * k)) for k in range(1, 4)]
 
-        for i in range(3):
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-                # Modify data slightly for each file
-                modified_rows = base_data.copy()
-                modified_rows[1][1] = str(100 * (i + 1))  # Different values
-                modified_rows[2][1] = str(200 * (i + 1))
+        # Create multiple CSV documents in memory
+        csv_texts = [_to_csv_text([["id", "value"], ["1", value1], ["2", value2]]) for value1, value2 in values]
 
-                for row in modified_rows:
-                    f.write(",".join(row) + "\n")
+        def process_one(text: str) -> TabularDataModel:
+            headers, rows = _parse_csv_text(text)
+            return TabularDataModel([headers] + rows)
 
-                test_files.append(f.name)
+        # Process all documents; each is independent, so this is a plain map
+        results = list(map(process_one, csv_texts))
 
-        try:
-            # Process all files
-            results = []
-            for file_path in test_files:
-                content = Path(file_path).read_text()
+        # Validate batch results
+        assert len(results) == 3
+        for model, (value1, value2) in zip(results, values, strict=True):
+            rows_list = list(model)
+            assert len(rows_list) == 2
+            # Check that values were modified correctly
+            assert rows_list[0][1] == value1
+            assert rows_list[1][1] == value2
 
-                lines = content.strip().split("\n")
-                headers = lines[0].split(",")
-                rows = [line.split(",") for line in lines[1:]]
 
-                model = TabularDataModel([headers] + rows)
-                results.append(model)
+@pytest.fixture(scope="class")
+def large_memory_model() -> TabularDataModel:
+    """Build the 5000 x 10 in-memory model once per test class."""
+    headers = [f"col_{i}" for i in range(10)]
+    return TabularDataModel([headers] + _large_rows(5000, 10))
 
-            # Validate batch results
-            assert len(results) == 3
-            for i, model in enumerate(results):
-                assert len(list(model)) == 2
-                # Check that values were modified correctly
-                expected_value1 = str(100 * (i + 1))
-                expected_value2 = str(200 * (i + 1))
-                rows_list = list(model)
-                assert rows_list[0][1] == expected_value1
-                assert rows_list[1][1] == expected_value2
 
-        finally:
-            # Clean up
-            for file_path in test_files:
-                Path(file_path).unlink()
+@pytest.fixture(scope="class")
+def large_stream_factory() -> Callable[[], Iterator[list[list[str]]]]:
+    """Return a builder of fresh 1000-row chunked streams over 10000 x 3 rows."""
+    rows = _large_rows(10000, 3)
+    return lambda: _chunked_stream(["a", "b", "c"], rows)
 
 
 class TestPerformanceScenarios:
     """Test performance characteristics and large data handling."""
 
-    def test_large_file_processing_memory_usage(self) -> None:
+    def test_large_file_processing_memory_usage(self, large_memory_model: TabularDataModel) -> None:
         """Test memory usage with large datasets."""
-        # Create moderately large dataset
-        headers = [f"col_{i}" for i in range(10)]
-        large_rows = [
-            [f"row_{row}_col_{col}" for col in range(10)]
-            for row in range(5000)  # 5000 rows
-        ]
-
-        # Test memory model with large data
-        memory_model = TabularDataModel([headers] + large_rows)
+        memory_model = large_memory_model
 
         # Validate data integrity
-        assert len(list(memory_model)) == 5000
+        all_rows = list(memory_model)
+        assert len(all_rows) == 5000
         assert len(memory_model.column_names) == 10
 
         # Test access patterns
-        all_rows = list(memory_model)
         first_row = all_rows[0]
         last_row = all_rows[-1]
         middle_row = all_rows[2500]
@@ -520,13 +499,12 @@ class TestPerformanceScenarios:
         assert last_row[0] == "row_4999_col_0"
         assert middle_row[0] == "row_2500_col_0"
 
-    def test_streaming_model_memory_efficiency(self) -> None:
+    def test_streaming_model_memory_efficiency(
+        self, large_stream_factory: Callable[[], Iterator[list[list[str]]]]
+    ) -> None:
         """Test that streaming model handles large data efficiently."""
         headers = ["a", "b", "c"]
-        # Create data that would be memory intensive if loaded all at once
-        large_rows = [[f"val_{i}_{j}" for j in range(3)] for i in range(10000)]
-
-        streaming_model = StreamingTabularDataModel(iter([[headers] + large_rows]))
+        streaming_model = StreamingTabularDataModel(large_stream_factory())
 
         # Test streaming access
         count = 0
@@ -538,11 +516,11 @@ class TestPerformanceScenarios:
 
         # Test dict streaming
         # Create new streaming model for dict iteration
-        data_stream2 = iter([[headers] + large_rows])
-        streaming_model2 = StreamingTabularDataModel(data_stream2)
+        streaming_model2 = StreamingTabularDataModel(large_stream_factory())
+        headers_set = frozenset(headers)
         dict_count = 0
         for row_dict in streaming_model2.iter_rows():
-            assert set(row_dict.keys()) == set(headers)
+            assert row_dict.keys() == headers_set
             dict_count += 1
 
         assert dict_count == 10000
@@ -551,7 +529,7 @@ class TestPerformanceScenarios:
 class TestErrorRecoveryWorkflows:
     """Test error recovery and resilience in complete workflows."""
 
-    def test_partial_failure_recovery(self) -> None:
+    def test_partial_failure_recovery(self, tmp_path: Path) -> None:
         """Test recovering from partial failures in batch processing."""
         # Create mix of valid and invalid files
         valid_data = ["id,value", "1,100", "2,200"]
@@ -559,45 +537,36 @@ class TestErrorRecoveryWorkflows:
 
         files_data = [valid_data, invalid_data, valid_data]
 
-        temp_files = []
-        try:
-            # Create temporary files
-            for data in files_data:
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-                    f.write("\n".join(data))
-                    temp_files.append(f.name)
-
-            # Process files with error handling
-            successful_models = []
-            failed_files = []
-
-            for file_path in temp_files:
-                try:
-                    content = Path(file_path).read_text()
-
-                    lines = content.strip().split("\n")
-                    headers = lines[0].split(",")
-                    rows = [line.split(",") for line in lines[1:]]
-
-                    # Try to convert values to numbers (this will fail for invalid data)
-                    for row in rows:
-                        row[1] = float(row[1])
-
-                    model = TabularDataModel([headers] + rows)
-                    successful_models.append(model)
-
-                except (ValueError, SplurgeTabularError) as e:
-                    failed_files.append((file_path, str(e)))
-
-            # Validate results
-            assert len(successful_models) == 2  # Two valid files
-            assert len(failed_files) == 1  # One invalid file
-
-            # Check successful models
-            for model in successful_models:
-                assert len(list(model)) == 2
-                assert model.column_names == ["id", "value"]
-
-        finally:
-            for file_path in temp_files:
-                Path(file_path).unlink()
+        # Create files under pytest's temporary directory, which cleans up after itself
+        file_paths = []
+        for i, data in enumerate(files_data):
+            file_path = tmp_path / f"file_{i}.csv"
+            file_path.write_text("\n".join(data))
+            file_paths.append(file_path)
+
+        # Process files with error handling
+        successful_models = []
+        failed_files = []
+
+        for file_path in file_paths:
+            try:
+                headers, rows = _parse_csv_text(file_path.read_text())
+
+                # Try to convert values to numbers (this will fail for invalid data)
+                for row in rows:
+                    row[1] = float(row[1])
+
+                model = TabularDataModel([headers] + rows)
+                successful_models.append(model)
+
+            except (ValueError, SplurgeTabularError) as e:
+                failed_files.append((file_path, str(e)))
+
+        # Validate results
+        assert len(successful_models) == 2  # Two valid files
+        assert len(failed_files) == 1  # One invalid file
+
+        # Check successful models
+        for model in successful_models:
+            assert sum(1 for _ in model) == 2
+            assert model.column_names == ["id", "value"]
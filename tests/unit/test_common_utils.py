@@ -13,7 +13,7 @@ from splurge_tabular.common_utils import (
     normalize_string,
     standardize_column_names,
 )
-from splurge_tabular.exceptions import SplurgeTabularTypeError
+from splurge_tabular.exceptions import SplurgeTabularTypeError, SplurgeTabularValueError
 
 
 class TestIsEmptyOrNone:
@@ -126,6 +126,13 @@ class TestEnsureMinimumColumns:
         result = ensure_minimum_columns(row, 0)
         assert result == ["a", "b"]
 
+    def test_padding_returns_new_list(self):
+        """Test that padding does not mutate the input row."""
+        row = ["a"]
+        result = ensure_minimum_columns(row, 3, fill_value="-")
+        assert result == ["a", "-", "-"]
+        assert row == ["a"]
+
     def test_none_row_raises_error(self):
         """Test with None row raises TypeError."""
         with pytest.raises(TypeError):
@@ -149,6 +156,29 @@ class TestBatchValidateRows:
 
         assert "Row 1 must be a list" in str(exc_info.value)
 
+    def test_error_mode_skip(self):
+        """Test that skip mode drops invalid rows without raising."""
+        rows = [["a", "b"], "not a list", ["e", "f"]]
+        result = list(batch_validate_rows(rows, error_mode="skip"))
+        assert result == [["a", "b"], ["e", "f"]]
+
+    def test_error_mode_count(self):
+        """Test that count mode drops invalid rows and records their indexes."""
+        rows = [["a", "b"], "not a list", ["e", "f"], None]
+        invalid_rows: list[int] = []
+        result = list(batch_validate_rows(rows, error_mode="count", invalid_rows=invalid_rows))
+        assert result == [["a", "b"], ["e", "f"]]
+        assert invalid_rows == [1, 3]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"error_mode": "ignore"}, {"error_mode": "count"}],
+    )
+    def test_error_mode_invalid_arguments(self, kwargs):
+        """Test that unknown modes and count mode without invalid_rows are rejected."""
+        with pytest.raises(SplurgeTabularValueError):
+            list(batch_validate_rows([["a"]], **kwargs))
+
     def test_empty_rows_list(self):
         """Test with empty rows list."""
         result = list(batch_validate_rows([], min_columns=1))
@@ -161,6 +191,22 @@ class TestBatchValidateRows:
         expected = [["a", "b"], ["c", "d"]]
         assert result == expected
 
+    def test_skip_whitespace_and_none_rows(self):
+        """Test that rows of whitespace, None, or no cells are skipped."""
+        rows = [[" ", "\t"], [None, ""], [], ["a", None]]
+        result = list(batch_validate_rows(rows, skip_empty=True))
+        assert result == [["a", ""]]
+
+    def test_trust_input(self):
+        """Test that trusted rows skip copying and are padded without mutation."""
+        full = ["a", "b"]
+        short = ["c"]
+        result = list(batch_validate_rows([full, ["", ""], short], min_columns=2, trust_input=True))
+
+        assert result == [["a", "b"], ["c", ""]]
+        assert result[0] is full
+        assert short == ["c"]
+
     def test_min_columns_padding(self):
         """Test minimum columns padding."""
         rows = [["a", "b"], ["c"]]
@@ -168,6 +214,19 @@ class TestBatchValidateRows:
         expected = [["a", "b", ""], ["c", "", ""]]
         assert result == expected
 
+    def test_mixed_cell_types_coerced(self):
+        """Test that non-string cells are coerced and None becomes empty."""
+        rows = [["a", 1, None, 2.5]]
+        result = list(batch_validate_rows(rows))
+        assert result == [["a", "1", "", "2.5"]]
+
+    def test_string_rows_are_copied(self):
+        """Test that yielded rows do not alias the input rows."""
+        rows = [["a", "b"]]
+        result = list(batch_validate_rows(rows))
+        assert result == rows
+        assert result[0] is not rows[0]
+
 
 class TestNormalizeString:
     """Test the normalize_string function."""
@@ -0,0 +1,46 @@
+"""Unit tests for splurge_tabular package initialization.
+
+Tests the lazily imported public API.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import splurge_tabular
+
+
+class TestLazyImports:
+    """Test PEP 562 lazy loading of public names."""
+
+    def test_all_public_names_resolve(self) -> None:
+        """Test that every name in __all__ can be resolved."""
+        for name in splurge_tabular.__all__:
+            assert getattr(splurge_tabular, name) is not None
+
+    def test_lazy_name_is_cached(self) -> None:
+        """Test that resolved names are cached in the module namespace."""
+        model_cls = splurge_tabular.TabularDataModel
+
+        assert vars(splurge_tabular)["TabularDataModel"] is model_cls
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = splurge_tabular.Missing
+
+    def test_dir_lists_lazy_names(self) -> None:
+        """Test that dir() includes names not yet imported."""
+        assert set(splurge_tabular.__all__) <= set(dir(splurge_tabular))
+
+    def test_cli_import_does_not_load_models(self) -> None:
+        """Test that importing the CLI leaves the data model modules unloaded."""
+        code = (
+            "import sys, splurge_tabular.cli; "
+            "print('splurge_tabular.tabular_data_model' in sys.modules, "
+            "'splurge_tabular.streaming_tabular_data_model' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False False"
@@ -274,7 +274,8 @@ class TestStreamingTabularDataProtocol:
 
         # Reset stream should not raise
         model.reset_stream()
-        assert not model._is_initialized
+        assert len(model._buffer) == 0
+        assert model.column_names == ["Name", "Age"]
 
     def test_streaming_protocol_duck_typing(self) -> None:
         """Test protocol-based duck typing for streaming protocol."""
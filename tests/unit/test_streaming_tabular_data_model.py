@@ -4,11 +4,17 @@ Unit tests for splurge_tabular.streaming_tabular_data_model module.
 Tests the StreamingTabularDataModel class for memory-efficient data processing.
 """
 
+import operator
+import threading
 from collections.abc import Iterator
 
 import pytest
 
-from splurge_tabular.exceptions import SplurgeTabularTypeError, SplurgeTabularValueError
+from splurge_tabular.exceptions import (
+    SplurgeTabularLookupError,
+    SplurgeTabularTypeError,
+    SplurgeTabularValueError,
+)
 from splurge_tabular.streaming_tabular_data_model import StreamingTabularDataModel
 
 
@@ -48,6 +54,48 @@ class TestStreamingTabularDataModel:
         assert model.column_names == ["Personal_Name", "Personal_Age"]
         assert model.column_count == 2
 
+    def test_stream_read_on_first_use(self):
+        """Test that construction does not read from the stream."""
+        reads = []
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            reads.append("chunk")
+            yield [["Name", "Age"], ["John", "30"]]
+
+        model = StreamingTabularDataModel(data_stream())
+        assert reads == []
+
+        assert model.column_names == ["Name", "Age"]
+        assert reads == ["chunk"]
+        assert list(model) == [["John", "30"]]
+
+    def test_header_rows_spanning_chunks(self):
+        """Test header rows split across chunks, with the rest of the last header chunk buffered."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield []
+            yield [["Personal", "Personal"]]
+            yield [["Name", "Age"], ["John", "30"], ["", ""]]
+            yield [["Jane", "25"]]
+
+        model = StreamingTabularDataModel(data_stream(), header_rows=2)
+
+        assert model.column_names == ["Personal_Name", "Personal_Age"]
+        assert list(model) == [["John", "30"], ["Jane", "25"]]
+
+    def test_buffer_bounded_by_chunk_size(self):
+        """Test that a large first chunk is only buffered up to chunk_size rows."""
+        rows = [[f"name{i}", str(i)] for i in range(250)]
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], *rows]
+
+        model = StreamingTabularDataModel(data_stream(), chunk_size=100)
+
+        assert model.column_names == ["Name", "Age"]
+        assert len(model._buffer) == 100
+        assert list(model) == rows
+
     def test_column_index_valid(self):
         """Test getting valid column index."""
 
@@ -123,6 +171,171 @@ class TestStreamingTabularDataModel:
         assert rows[1] == ["", ""]
         assert rows[2] == ["Jane", "25"]
 
+    def test_iter_yields_full_width_rows_without_copying(self):
+        """Test that full-width rows are yielded as-is and short rows are padded copies."""
+        full = ["John", "30"]
+        short = ["Jane"]
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], full]
+            yield [short]
+
+        model = StreamingTabularDataModel(data_stream())
+        rows = list(model)
+
+        assert rows == [["John", "30"], ["Jane", ""]]
+        assert rows[0] is full
+        assert short == ["Jane"]
+
+    def test_copy_rows(self):
+        """Test that copy_rows yields new lists for full-width rows."""
+        full = ["John", "30"]
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], full]
+
+        model = StreamingTabularDataModel(data_stream(), copy_rows=True)
+        rows = list(model)
+
+        assert rows == [["John", "30"]]
+        assert rows[0] is not full
+
+    def test_strict_schema_rejects_wide_row(self):
+        """Test that strict_schema raises instead of widening the header."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"], ["Bob", "40", "NYC"]]
+
+        model = StreamingTabularDataModel(data_stream(), strict_schema=True)
+
+        with pytest.raises(SplurgeTabularValueError):
+            list(model)
+        assert model.column_names == ["Name", "Age"]
+
+    def test_strict_schema_without_headers_skips_leading_empty_chunks(self):
+        """Test that headerless schemas come from the first chunk with data rows."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield []
+            yield [["", ""], [" "]]
+            yield [["John", "30"]]
+            yield [["Jane", "25"]]
+
+        model = StreamingTabularDataModel(data_stream(), header_rows=0, strict_schema=True)
+
+        assert model.column_names == ["column_0", "column_1"]
+        assert list(model) == [["John", "30"], ["Jane", "25"]]
+
+    def test_strict_schema_without_headers_ragged_first_chunk(self):
+        """Test that headerless schemas are as wide as the widest buffered row."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["John"], ["Jane", "25", "LA"]]
+
+        model = StreamingTabularDataModel(data_stream(), header_rows=0, strict_schema=True)
+
+        assert model.column_count == 3
+        assert list(model) == [["John", "", ""], ["Jane", "25", "LA"]]
+
+    def test_on_schema_widen_called_once_per_chunk(self):
+        """Test that on_schema_widen reports each widening before its rows are yielded."""
+        events: list[tuple[int, int]] = []
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25", "NYC"], ["Bob", "40", "LA", "x"]]
+            yield [["Ann", "22", "SF"]]
+
+        model = StreamingTabularDataModel(data_stream(), on_schema_widen=lambda old, new: events.append((old, new)))
+        it = iter(model)
+        assert next(it) == ["John", "30"]
+        assert events == []
+        assert next(it) == ["Jane", "25", "NYC", ""]
+        assert events == [(2, 4)]
+        list(it)
+        assert events == [(2, 4)]
+
+    def test_iter_pads_chunk_to_widest_row(self):
+        """Test that a wider row widens the header for its whole chunk."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25"], ["Bob", "40", "NYC"]]
+
+        model = StreamingTabularDataModel(data_stream())
+        rows = list(model)
+
+        assert rows == [["John", "30"], ["Jane", "25", ""], ["Bob", "40", "NYC"]]
+        assert model.column_names == ["Name", "Age", "column_2"]
+
+    def test_intern_columns(self):
+        """Test that intern_columns pools repeated values across chunks."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Dept"], ["John", "".join(["Sa", "les"])]]
+            yield [["Jane", "".join(["Sal", "es"])], ["Bob", "HR"]]
+
+        model = StreamingTabularDataModel(data_stream(), intern_columns=["Dept"])
+        rows = list(model)
+
+        assert rows == [["John", "Sales"], ["Jane", "Sales"], ["Bob", "HR"]]
+        assert rows[0][1] is rows[1][1]
+        assert model.pool_stats() == (1, 2, 2)
+
+    def test_intern_columns_leave_stream_rows_unchanged(self):
+        """Test that interning writes into copies, padding short rows in the same copy."""
+        dept = "".join(["Sa", "les"])
+        full = [dept, "John"]
+        short = ["".join(["Sal", "es"])]
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Dept", "Name"], ["Sales", "Ann"], full, short]
+
+        model = StreamingTabularDataModel(data_stream(), intern_columns=["Dept"])
+        rows = list(model)
+
+        assert rows == [["Sales", "Ann"], ["Sales", "John"], ["Sales", ""]]
+        assert rows[0][0] is rows[1][0] is rows[2][0]
+        assert full[0] is dept
+        assert short == ["Sales"]
+
+    def test_intern_columns_pool_is_bounded(self):
+        """Test that new values pass through once the pool is full."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Dept"], ["A"], ["B"], ["B"]]
+
+        model = StreamingTabularDataModel(data_stream(), intern_columns=["Dept"])
+        model.INTERN_POOL_MAX_SIZE = 1
+        rows = list(model)
+
+        assert rows == [["A"], ["B"], ["B"]]
+        assert model.pool_stats() == (0, 3, 1)
+
+    def test_intern_columns_unknown_column(self):
+        """Test that intern_columns rejects names that are not columns."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name"], ["John"]]
+
+        model = StreamingTabularDataModel(data_stream(), intern_columns=["Missing"])
+
+        with pytest.raises(SplurgeTabularLookupError):
+            _ = model.column_names
+        # The model is not left half-initialized; later access still raises
+        with pytest.raises(SplurgeTabularLookupError):
+            list(model)
+
+    def test_length_hint(self):
+        """Test that the length hint reports an unknown row count."""
+        chunks = [[["Name"], ["John"], ["Jane"]], [["Bob"]], [["Eve"]]]
+        model = StreamingTabularDataModel(iter(chunks), chunk_size=1000)
+
+        assert operator.length_hint(model, 7) == 7
+        _ = model.column_names
+        assert operator.length_hint(model, 7) == 7
+        assert len(list(model)) == 4
+
     def test_iter_rows_as_dicts(self):
         """Test iterating rows as dictionaries."""
 
@@ -136,6 +349,56 @@ class TestStreamingTabularDataModel:
         assert rows[0] == {"Name": "John", "Age": "30"}
         assert rows[1] == {"Name": "Jane", "Age": "25"}
 
+    @pytest.mark.parametrize(
+        ("row_format", "expected"),
+        [
+            ("dict", [{"Name": "John", "Age": "30"}, {"Name": "Jane", "Age": "25"}]),
+            ("tuple", [("John", "30"), ("Jane", "25")]),
+            ("list", [["John", "30"], ["Jane", "25"]]),
+        ],
+    )
+    def test_iter_rows_row_format(self, row_format, expected):
+        """Test iter_rows yields rows in the requested format."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
+
+        model = StreamingTabularDataModel(data_stream())
+
+        assert list(model.iter_rows(row_format=row_format)) == expected
+
+    def test_iter_rows_reuse_row(self):
+        """Test reuse_row yields one dict updated in place, including widened columns."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25", "NYC"]]
+
+        model = StreamingTabularDataModel(data_stream())
+
+        seen = []
+        snapshots = []
+        for row in model.iter_rows(reuse_row=True):
+            seen.append(row)
+            snapshots.append(dict(row))
+
+        assert seen[0] is seen[1]
+        assert snapshots == [
+            {"Name": "John", "Age": "30"},
+            {"Name": "Jane", "Age": "25", "column_2": "NYC"},
+        ]
+
+    def test_iter_rows_invalid_row_format(self):
+        """Test iter_rows rejects unknown formats before iterating."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+
+        model = StreamingTabularDataModel(data_stream())
+
+        with pytest.raises(SplurgeTabularValueError):
+            model.iter_rows(row_format="records")  # type: ignore[call-overload]
+
     def test_iter_rows_as_tuples(self):
         """Test iterating rows as tuples."""
 
@@ -209,6 +472,19 @@ class TestStreamingTabularDataModel:
         # We can't directly test buffer state, but we can test that operations still work
         assert model.column_names == ["Name", "Age"]
 
+    def test_clear_buffer_before_first_use(self):
+        """Test that clear_buffer reads the header first and discards the first chunk's rows."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25"]]
+
+        model = StreamingTabularDataModel(data_stream())
+        model.clear_buffer()
+
+        assert model.column_names == ["Name", "Age"]
+        assert list(model) == [["Jane", "25"]]
+
     def test_reset_stream(self):
         """Test resetting the stream through public behavior."""
 
@@ -256,3 +532,91 @@ class TestStreamingTabularDataModel:
 
         assert len(rows) == 0
         assert model.column_count == 0
+
+    def test_prefetch_yields_same_rows(self):
+        """Test that prefetching chunks on a background thread preserves order and content."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25"], ["", ""]]
+            yield [["Bob", "35", "NYC"]]
+
+        model = StreamingTabularDataModel(data_stream(), prefetch=2)
+        rows = list(model)
+
+        assert rows == [["John", "30"], ["Jane", "25"], ["Bob", "35", "NYC"]]
+        assert model.column_names == ["Name", "Age", "column_2"]
+
+    def test_prefetch_propagates_stream_errors(self):
+        """Test that errors raised by the stream surface in the consuming thread."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name", "Age"], ["John", "30"]]
+            yield [["Jane", "25"]]
+            raise RuntimeError("read failed")
+
+        model = StreamingTabularDataModel(data_stream(), prefetch=1)
+
+        rows = []
+        with pytest.raises(RuntimeError, match="read failed"):
+            for row in model:
+                rows.append(row)
+        assert rows == [["John", "30"], ["Jane", "25"]]
+
+    def test_prefetch_stopped_by_clear_buffer(self):
+        """Test that clear_buffer stops a running prefetch."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["Name"], ["a"]]
+            for i in range(100):
+                yield [[f"row{i}"]]
+
+        model = StreamingTabularDataModel(data_stream(), prefetch=1)
+        rows = iter(model)
+
+        assert next(rows) == ["a"]
+        assert next(rows) == ["row0"]
+        model.clear_buffer()
+        assert list(rows) == []
+
+    def test_prefetch_early_break_resumes(self):
+        """Test that chunks read ahead before an early break are yielded by the next iteration."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["n"], ["0"]]
+            for i in range(1, 10):
+                yield [[str(i)]]
+
+        model = StreamingTabularDataModel(data_stream(), prefetch=3)
+
+        seen = []
+        for row in model:
+            seen.append(row[0])
+            if row[0] == "1":
+                break
+
+        assert seen == ["0", "1"]
+        assert [row[0] for row in model] == [str(i) for i in range(2, 10)]
+
+    def test_prefetch_reset_during_iteration(self):
+        """Test that reset_stream ends a prefetching iteration without hanging or leaking the thread."""
+
+        def data_stream() -> Iterator[list[list[str]]]:
+            yield [["n"], ["0"]]
+            for i in range(1, 100):
+                yield [[str(i)]]
+
+        model = StreamingTabularDataModel(data_stream(), prefetch=2)
+        rows = iter(model)
+
+        assert next(rows) == ["0"]
+        assert next(rows) == ["1"]
+        model.reset_stream()
+
+        assert list(rows) == []
+        assert not any(t.name == "splurge-tabular-prefetch" and t.is_alive() for t in threading.enumerate())
+
+    def test_prefetch_validation(self):
+        """Test that a negative prefetch depth is rejected."""
+        with pytest.raises(SplurgeTabularValueError, match="Prefetch must be greater than or equal to 0"):
+            StreamingTabularDataModel(iter([]), prefetch=-1)
@@ -4,9 +4,13 @@ Unit tests for splurge_tabular.tabular_data_model module.
 Tests the main TabularDataModel class.
 """
 
+import operator
+
 import pytest
 
 from splurge_tabular._vendor.splurge_typer.data_type import DataType
+from splurge_tabular._vendor.splurge_typer.string import String
+from splurge_tabular._vendor.splurge_typer.type_inference import TypeInference
 from splurge_tabular.exceptions import SplurgeTabularLookupError, SplurgeTabularTypeError, SplurgeTabularValueError
 from splurge_tabular.tabular_data_model import TabularDataModel
 
@@ -37,6 +41,16 @@ class TestTabularDataModel:
         assert model.column_count == 0  # No data columns when no data rows
         assert model.column_names == ["Name", "Age"]  # But header names exist
 
+    def test_header_only_column_access(self):
+        """Test that header-only columns read as empty rather than failing."""
+        model = TabularDataModel([["Name", "Age"]])
+
+        assert model.column_values("Name") == []
+        assert model.column_type("Name") == DataType.EMPTY
+        assert model.infer_all_column_types() == {"Name": DataType.EMPTY, "Age": DataType.EMPTY}
+        assert model.to_typed().column_values("Age") == []
+        assert list(model) == []
+
     def test_multiple_header_rows(self):
         """Test with multiple header rows."""
         data = [["Personal", "Personal"], ["Name", "Age"], ["John", "30"]]
@@ -98,6 +112,67 @@ class TestTabularDataModel:
         _score_type = model.column_type("Score")
         # Types would depend on the inference implementation
 
+    def test_intern_columns(self):
+        """Test intern_columns shares one string object per repeated value."""
+        data = [["Name", "Dept"]] + [[f"user{i}", "".join(["Engin", "eering"])] for i in range(3)]
+        model = TabularDataModel(data, intern_columns=["Dept"])
+
+        depts = model.column_values("Dept")
+        assert depts == ["Engineering"] * 3
+        assert depts[0] is depts[1] is depts[2]
+        assert model.column_values("Name") == ["user0", "user1", "user2"]
+
+    def test_intern_columns_unknown_column(self):
+        """Test intern_columns rejects names that are not columns."""
+        data = [["Name"], ["John"]]
+
+        with pytest.raises(SplurgeTabularLookupError):
+            TabularDataModel(data, intern_columns=["Missing"])
+
+    def test_infer_all_column_types(self):
+        """Test inferring every column type at once shares the column_type cache."""
+        data = [["Name", "Age", "Score"], ["John", "30", "85.5"], ["Jane", "25", "92.0"]]
+        model = TabularDataModel(data)
+
+        types = model.infer_all_column_types()
+
+        assert list(types) == ["Name", "Age", "Score"]
+        assert types["Age"] == DataType.INTEGER
+        assert types["Score"] == DataType.FLOAT
+        assert all(model.column_type(name) == dtype for name, dtype in types.items())
+
+    def test_type_sample_size(self):
+        """Test that column types are inferred from the leading sample when it is conclusive."""
+        data = [["Late", "Early"], ["1", "1"], ["2", "x"], ["x", "3"]]
+
+        sampled = TabularDataModel(data, type_sample_size=2)
+        assert sampled.column_type("Late") == DataType.INTEGER
+        assert sampled.column_type("Early") == DataType.MIXED
+        assert sampled.to_typed().column_type("Late") == DataType.INTEGER
+
+        full = TabularDataModel(data)
+        assert full.column_type("Late") == DataType.MIXED
+        assert full.to_typed().column_type("Late") == DataType.MIXED
+
+        with pytest.raises(SplurgeTabularValueError):
+            TabularDataModel(data, type_sample_size=0)
+
+    def test_infer_all_column_types_parallel(self):
+        """Test parallel inference on a table above the thread-pool thresholds."""
+        rows = TabularDataModel.PARALLEL_INFERENCE_MIN_ROWS
+        data = [["Name", "Age", "Score", "Active"]]
+        data.extend([f"Row{i}", str(i), f"{i}.5", "true"] for i in range(rows))
+        model = TabularDataModel(data)
+
+        types = model.infer_all_column_types()
+
+        assert types == {
+            "Name": DataType.STRING,
+            "Age": DataType.INTEGER,
+            "Score": DataType.FLOAT,
+            "Active": DataType.BOOLEAN,
+        }
+
     def test_column_values(self):
         """Test getting all values for a column."""
         data = [["Name", "Age"], ["John", "30"], ["Jane", "25"], ["Bob", "35"]]
@@ -109,6 +184,63 @@ class TestTabularDataModel:
         assert name_values == ["John", "Jane", "Bob"]
         assert age_values == ["30", "25", "35"]
 
+    def test_column_values_copy(self):
+        """Test column_values returns the stored column unless a copy is requested."""
+        data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
+        model = TabularDataModel(data)
+
+        assert model.column_values("Name") is model.column_values("Name")
+
+        copied = model.column_values("Name", copy=True)
+        assert copied == ["John", "Jane"]
+        copied.append("Bob")
+        assert model.column_values("Name") == ["John", "Jane"]
+
+    def test_row_accessors_are_independent_of_store(self):
+        """Test that rows built from the column store can be mutated safely."""
+        data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
+        model = TabularDataModel(data)
+
+        row = model.row_as_list(0)
+        row[0] = "Changed"
+        next(iter(model))[1] = "99"
+
+        assert model.row_as_list(0) == ["John", "30"]
+        assert model.cell_value("Name", 0) == "John"
+
+    def test_zero_width_rows_preserved(self):
+        """Test that kept empty rows without columns are still iterated."""
+        model = TabularDataModel([[], []], header_rows=0, skip_empty_rows=False)
+
+        assert model.row_count == 2
+        assert list(model) == [[], []]
+        assert list(model.iter_rows_as_tuples()) == [(), ()]
+
+    def test_column_values_as_array(self):
+        """Test NumPy array access to a column."""
+        np = pytest.importorskip("numpy")
+        data = [["Name", "Salary"], ["John", "75000"], ["Jane", "82000"]]
+        model = TabularDataModel(data)
+
+        names = model.column_values_as_array("Name")
+        assert names.dtype == object
+        assert names.tolist() == ["John", "Jane"]
+
+        salaries = model.column_values_as_array("Salary", dtype=np.int64)
+        assert salaries.dtype == np.int64
+        assert salaries.sum() == 157000
+
+    def test_column_values_as_array_errors(self):
+        """Test array conversion errors surface as package exceptions."""
+        np = pytest.importorskip("numpy")
+        data = [["Name", "Age"], ["John", ""]]
+        model = TabularDataModel(data)
+
+        with pytest.raises(SplurgeTabularValueError):
+            model.column_values_as_array("Age", dtype=np.int64)
+        with pytest.raises(SplurgeTabularLookupError):
+            model.column_values_as_array("Invalid")
+
     def test_column_values_invalid_column(self):
         """Test column_values with invalid column name."""
         data = [["Name", "Age"], ["John", "30"]]
@@ -142,6 +274,11 @@ class TestTabularDataModel:
         with pytest.raises(SplurgeTabularLookupError):
             model.cell_value("Name", 5)
 
+    def test_length_hint(self):
+        """Test that the length hint reports the row count."""
+        model = TabularDataModel([["Name"], ["John"], ["Jane"]])
+        assert operator.length_hint(model) == 2
+
     def test_iter_rows(self):
         """Test iterating over rows as dictionaries."""
         data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
@@ -151,6 +288,52 @@ class TestTabularDataModel:
         expected = [{"Name": "John", "Age": "30"}, {"Name": "Jane", "Age": "25"}]
         assert rows == expected
 
+    @pytest.mark.parametrize(
+        ("row_format", "expected"),
+        [
+            ("dict", [{"Name": "John", "Age": "30"}, {"Name": "Jane", "Age": "25"}]),
+            ("tuple", [("John", "30"), ("Jane", "25")]),
+            ("list", [["John", "30"], ["Jane", "25"]]),
+        ],
+    )
+    def test_iter_rows_row_format(self, row_format, expected):
+        """Test iter_rows yields rows in the requested format."""
+        data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
+        model = TabularDataModel(data)
+
+        assert list(model.iter_rows(row_format=row_format)) == expected
+
+    def test_iter_rows_reuse_row(self):
+        """Test reuse_row yields one dict updated in place for each row."""
+        data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
+        model = TabularDataModel(data)
+
+        seen = []
+        snapshots = []
+        for row in model.iter_rows(reuse_row=True):
+            seen.append(row)
+            snapshots.append(dict(row))
+
+        assert seen[0] is seen[1]
+        assert snapshots == list(model.iter_rows())
+
+    def test_iter_rows_reuse_row_header_wider_than_data(self):
+        """Test reused dicts have the same keys as new dicts when the header is wider."""
+        model = TabularDataModel([["a", "b", "c"], ["1", "2"]])
+
+        reused = [dict(row) for row in model.iter_rows(reuse_row=True)]
+
+        assert reused == list(model.iter_rows()) == [model.row(0)]
+        assert reused == [{"a": "1", "b": "2"}]
+
+    def test_iter_rows_invalid_row_format(self):
+        """Test iter_rows rejects unknown formats before iterating."""
+        data = [["Name", "Age"], ["John", "30"]]
+        model = TabularDataModel(data)
+
+        with pytest.raises(SplurgeTabularValueError):
+            model.iter_rows(row_format="records")  # type: ignore[call-overload]
+
     def test_iter_rows_as_tuples(self):
         """Test iterating over rows as tuples."""
         data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
@@ -222,6 +405,28 @@ class TestTabularDataModel:
         assert typed_view.column_count == model.column_count
         assert typed_view.column_names == model.column_names
 
+    def test_to_typed_is_memoized_per_config(self):
+        """Test that equal type configurations share one typed view."""
+        data = [["Name", "Age"], ["John", "30"], ["Jane", ""]]
+        model = TabularDataModel(data)
+
+        assert model.to_typed() is model.to_typed()
+        assert model.to_typed() is model.to_typed(type_configs={})
+
+        custom = model.to_typed(type_configs={DataType.INTEGER: 999})
+        assert custom is model.to_typed(type_configs={DataType.INTEGER: 999})
+        assert custom is not model.to_typed()
+        assert custom is not model.to_typed(type_configs={DataType.INTEGER: True})
+        assert custom.cell_value("Age", 1) == 999
+
+    def test_to_typed_unhashable_config_not_cached(self):
+        """Test that unhashable configuration values still produce a view."""
+        data = [["Name"], ["John"]]
+        model = TabularDataModel(data)
+
+        config = {DataType.STRING: ["unhashable"]}
+        assert model.to_typed(type_configs=config) is not model.to_typed(type_configs=config)
+
     def test_typed_view_column_values(self):
         """Test typed view column values."""
         data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
@@ -233,6 +438,95 @@ class TestTabularDataModel:
         _age_values = typed_view.column_values("Age")
         # Values should be typed appropriately
 
+    def test_typed_view_column_values_match_cell_conversion(self):
+        """Test that whole-column conversion matches converting each cell."""
+        data = [
+            ["Int", "Float", "Bool", "Date", "Text"],
+            ["1", "1.5", "true", "2023-01-01", "a"],
+            ["", "", "", "", "null"],
+            ["3", "2.5", "false", "2023-01-03", ""],
+        ]
+        model = TabularDataModel(data)
+        typed_view = model.to_typed(type_configs={DataType.INTEGER: -1})
+
+        for name in model.column_names:
+            expected = [typed_view.cell_value(name, i) for i in range(model.row_count)]
+            assert typed_view.column_values(name) == expected
+        assert typed_view.column_values("Int") == [1, -1, 3]
+
+    @pytest.mark.parametrize(
+        ("dtype", "values", "expected"),
+        [
+            (DataType.INTEGER, ["12", "-3", "+4", " 5 ", "abc"], [12, -3, 4, 5, 0]),
+            (DataType.FLOAT, ["1.5", ".5", "5.", "-2.25", " 3 ", "1e5", "x"], [1.5, 0.5, 5.0, -2.25, 3.0, 0.0, 0.0]),
+        ],
+    )
+    def test_typed_view_numeric_parsing(self, dtype, values, expected):
+        """Test that numeric fast paths and the String fallback agree on edge cases."""
+        model = TabularDataModel([["Value"], *[[v] for v in values]])
+        typed_view = model.to_typed()
+        converter = typed_view._converters[dtype]
+
+        assert [converter(v) for v in values] == expected
+
+    def test_typed_view_column_values_cached(self):
+        """Test that converted columns are cached unless cache_columns is disabled."""
+        data = [["Age"], ["30"], ["25"]]
+        model = TabularDataModel(data)
+
+        typed_view = model.to_typed()
+        values = typed_view.column_values("Age")
+        assert values == [30, 25]
+        assert typed_view.column_values("Age") is values
+        assert typed_view.column_values("Age", copy=True) is not values
+
+        uncached = model.to_typed(cache_columns=False)
+        assert uncached is not typed_view
+        assert uncached is model.to_typed(cache_columns=False)
+        assert uncached.column_values("Age") == [30, 25]
+        assert uncached.column_values("Age") is not uncached.column_values("Age")
+
+    def test_typed_view_value_kind_matches_string_predicates(self):
+        """Test that value classification agrees with String.is_none_like/is_empty_like."""
+        typed_view = TabularDataModel([["A"], ["x"]]).to_typed()
+        samples = ["", " ", "\t", "none", " NULL ", "Null", "n/a", "nil", "nonee", "0", "x"]
+
+        for value in samples:
+            if String.is_none_like(value):
+                expected = typed_view._KIND_NONE
+            elif String.is_empty_like(value):
+                expected = typed_view._KIND_EMPTY
+            else:
+                expected = typed_view._KIND_VALUE
+            assert typed_view._value_kind(value) == expected, value
+
+    def test_typed_view_value_kind_cache_bounded(self, monkeypatch):
+        """Test that the empty/none-like classification cache stops growing at its limit."""
+        data = [["Text"], ["a"], ["null"], [" "], ["b"], ["a"]]
+        model = TabularDataModel(data, skip_empty_rows=False)
+        typed_view = model.to_typed()
+        monkeypatch.setattr(type(typed_view), "VALUE_KIND_CACHE_MAX_SIZE", 2)
+
+        assert typed_view.column_values("Text") == ["a", "", "", "b", "a"]
+        assert len(typed_view._value_kinds) == 2
+
+    def test_typed_view_column_type_profiles_clean_mixed_column_once(self, monkeypatch):
+        """Test that a MIXED column without empty values is profiled in a single pass."""
+        data = [["Mixed"], ["1"], ["text"], ["2.5"]]
+        model = TabularDataModel(data)
+        typed_view = model.to_typed()
+        profiled: list[list[str]] = []
+        original = TypeInference.profile_values
+
+        def counting_profile(values):
+            profiled.append(list(values))
+            return original(values)
+
+        monkeypatch.setattr(TypeInference, "profile_values", counting_profile)
+
+        assert typed_view.column_type("Mixed") == DataType.MIXED
+        assert profiled == [["1", "text", "2.5"]]
+
     def test_typed_view_cell_value(self):
         """Test typed view cell value."""
         data = [["Name", "Age"], ["John", "30"], ["Jane", "25"]]
@@ -261,6 +555,16 @@ class TestTabularDataModel:
         _rows = list(typed_view)
         # Rows should be typed lists
 
+    def test_init_validate_checks_every_row(self):
+        """Test that validate=True rejects non-list rows beyond the first."""
+        data = [["Name", "Age"], ["John", "30"], ("Jane", "25")]
+
+        assert TabularDataModel(data).row_count == 2
+        with pytest.raises(SplurgeTabularTypeError):
+            TabularDataModel(data, validate=True)
+        with pytest.raises(SplurgeTabularTypeError):
+            TabularDataModel([("Name", "Age")])
+
     def test_init_invalid_header_rows_type(self):
         """Test __init__ with invalid header_rows type."""
         data = [["Name", "Age"], ["John", "30"]]
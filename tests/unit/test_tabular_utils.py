@@ -5,7 +5,9 @@ Tests header processing, row normalization, and utility functions.
 """
 
 from splurge_tabular.tabular_utils import (
+    ROW_DICT_CODEGEN_MAX_COLUMNS,
     auto_column_names,
+    make_row_dict_builder,
     normalize_rows,
     process_headers,
     should_skip_row,
@@ -73,6 +75,15 @@ class TestProcessHeaders:
         # Column names should be based on max columns across all rows
         assert column_names == ["A", "B", "column_2"]
 
+    def test_column_names_are_interned(self):
+        """Test that column names are interned strings."""
+        import sys
+
+        header_data = [["".join(["Na", "me"]), "  Age  "]]
+        _, column_names = process_headers(header_data, header_rows=1)
+
+        assert all(name is sys.intern(name) for name in column_names)
+
 
 class TestNormalizeRows:
     """Test the normalize_rows function."""
@@ -126,6 +137,10 @@ class TestShouldSkipRow:
         row = ["", "", ""]
         assert should_skip_row(row) is True
 
+    def test_row_without_cells(self):
+        """Test skipping a row with no cells."""
+        assert should_skip_row([]) is True
+
     def test_whitespace_only_row(self):
         """Test skipping row with only whitespace."""
         row = ["  ", "\t", "\n"]
@@ -170,3 +185,33 @@ class TestAutoColumnNames:
         result = auto_column_names(5)
         expected = ["column_0", "column_1", "column_2", "column_3", "column_4"]
         assert result == expected
+
+
+class TestMakeRowDictBuilder:
+    """Test the make_row_dict_builder function."""
+
+    def test_builds_dict_from_row(self):
+        """Test converting a row into a dictionary."""
+        to_dict = make_row_dict_builder(("Name", "Age"))
+        assert to_dict(["John", "30"]) == {"Name": "John", "Age": "30"}
+        assert to_dict(("Jane", "25")) == {"Name": "Jane", "Age": "25"}
+
+    def test_builder_is_cached(self):
+        """Test that builders are reused for the same column names."""
+        assert make_row_dict_builder(("a", "b")) is make_row_dict_builder(("a", "b"))
+
+    def test_names_are_not_evaluated_as_code(self):
+        """Test that names containing quotes or code are used verbatim."""
+        names = ("it's", '"quoted"', "}); import os; ({")
+        to_dict = make_row_dict_builder(names)
+        assert to_dict(["1", "2", "3"]) == dict(zip(names, ["1", "2", "3"], strict=True))
+
+    def test_zero_columns(self):
+        """Test that an empty schema produces empty dictionaries."""
+        assert make_row_dict_builder(())([]) == {}
+
+    def test_wide_schema_fallback(self):
+        """Test schemas wider than the codegen limit."""
+        names = tuple(auto_column_names(ROW_DICT_CODEGEN_MAX_COLUMNS + 1))
+        row = list(map(str, range(len(names))))
+        assert make_row_dict_builder(names)(row) == dict(zip(names, row, strict=True))